@@ -38,5 +38,5 @@ console_handler.setFormatter(formatter)
 # Add handler to logger
 root_logger.addHandler(console_handler)
 
-# Log initialization
-root_logger.info(f"Initializing {APP_NAME} v{APP_VERSION}")
+# Log initialization (lazy %-style so quiet log levels skip formatting)
+root_logger.info("Initializing %s v%s", APP_NAME, APP_VERSION)
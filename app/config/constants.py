@@ -12,6 +12,7 @@ MPS_TO_FPM = 196.85   # Meters per second to feet per minute
 DEFAULT_UDP_PORT = 49002
 DEFAULT_BUFFER_SIZE = 1024
 DEFAULT_ENCODING = 'utf-8'
+UDP_RECEIVE_BUFFER_BYTES = 4 * 1024 * 1024  # Kernel receive buffer for packet bursts
 
 # IGC file related constants
 IGC_EXTENSION = '.igc'
@@ -7,9 +7,17 @@ import os
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import ClassVar, Dict, Any, Optional
 from .constants import DEFAULT_UDP_PORT
 
+# Use orjson for the settings file when available (C implementation,
+# several times faster than stdlib json); optional with a silent
+# fallback, as elsewhere in the tree
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -17,6 +25,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger("aerofly_igc_recorder.settings")
 
+# Sentinel distinguishing "key absent" from a stored None in set()
+_UNSET = object()
+
 
 class Settings:
     """
@@ -25,6 +36,29 @@ class Settings:
     """
     _instance = None
 
+    # Default settings, built once at class creation and copied per
+    # instance. The IGC directory default is filled in after loading:
+    # computing it touches the filesystem (expanduser + makedirs),
+    # which is wasted startup I/O whenever the settings file already
+    # names a directory.
+    _DEFAULTS: ClassVar[Dict[str, Any]] = {
+        # Network settings
+        "udp_port": DEFAULT_UDP_PORT,
+
+        # Recording settings
+        "default_pilot_name": "Simulator Pilot",
+        "default_glider_type": "Aerofly FS4",
+        "default_glider_id": "SIM",
+        "recording_interval": 1.0,  # seconds
+
+        # UI settings
+        "window_width": 600,
+        "window_height": 580,
+        "theme": "system",  # Can be "light", "dark", or "system"
+        "show_tooltips": True,
+        "log_level": "INFO",
+    }
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(Settings, cls).__new__(cls)
@@ -35,33 +69,30 @@ class Settings:
         if self._initialized:
             return
         
-        # Default settings
-        self._settings = {
-            # Network settings
-            "udp_port": DEFAULT_UDP_PORT,
-            
-            # File paths
-            "igc_directory": self._get_default_igc_dir(),
-            
-            # Recording settings
-            "default_pilot_name": "Simulator Pilot",
-            "default_glider_type": "Aerofly FS4",
-            "default_glider_id": "SIM",
-            "recording_interval": 1.0,  # seconds
-            
-            # UI settings
-            "window_width": 600,
-            "window_height": 580,
-            "theme": "system",  # Can be "light", "dark", or "system"
-            "show_tooltips": True,
-            "log_level": "INFO",
-        }
-        
+        self._settings = dict(self._DEFAULTS)
+
         # Load settings from file if it exists
         self._config_dir = self._get_config_dir()
         self._config_file = os.path.join(self._config_dir, "settings.json")
-        self._load_settings()
-        
+
+        # Dirty bit: save_settings becomes a no-op while nothing has
+        # changed since the last successful write
+        self._dirty = False
+
+        # Single existence check here; the load path itself assumes the
+        # file is present
+        if os.path.exists(self._config_file):
+            self._load_settings()
+        else:
+            logger.info("No settings file found, using defaults")
+            self._dirty = True
+            self.save_settings()  # Create default settings file
+
+        # Only create the default IGC directory if the loaded settings
+        # didn't provide one
+        if "igc_directory" not in self._settings:
+            self._settings["igc_directory"] = self._get_default_igc_dir()
+
         self._initialized = True
 
     @staticmethod
@@ -89,23 +120,38 @@ class Settings:
     def _load_settings(self) -> None:
         """Load settings from the configuration file"""
         try:
-            if os.path.exists(self._config_file):
+            if orjson is not None:
+                with open(self._config_file, 'rb') as f:
+                    loaded_settings = orjson.loads(f.read())
+            else:
                 with open(self._config_file, 'r') as f:
                     loaded_settings = json.load(f)
-                    # Update default settings with loaded ones
-                    self._settings.update(loaded_settings)
-                logger.info(f"Settings loaded from {self._config_file}")
-            else:
-                logger.info("No settings file found, using defaults")
-                self.save_settings()  # Create default settings file
+            # Update default settings with loaded ones
+            self._settings.update(loaded_settings)
+            logger.info(f"Settings loaded from {self._config_file}")
         except Exception as e:
             logger.error(f"Error loading settings: {e}")
 
     def save_settings(self) -> bool:
         """Save current settings to the configuration file"""
+        # Nothing changed since the last write: skip the serialization
+        # and disk I/O entirely
+        if not self._dirty:
+            return True
+
         try:
-            with open(self._config_file, 'w') as f:
-                json.dump(self._settings, f, indent=4)
+            # Write to a sibling temp file and move it into place, so a
+            # crash mid-write can never leave a truncated settings file
+            tmp_file = self._config_file + ".tmp"
+            if orjson is not None:
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(self._settings, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w') as f:
+                    json.dump(self._settings, f, indent=4)
+            os.replace(tmp_file, self._config_file)
+
+            self._dirty = False
             logger.info(f"Settings saved to {self._config_file}")
             return True
         except Exception as e:
@@ -117,8 +163,11 @@ class Settings:
         return self._settings.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        """Set a setting value by key"""
-        self._settings[key] = value
+        """Set a setting value by key; no-op (and no dirty mark) when
+        the value is unchanged"""
+        if self._settings.get(key, _UNSET) != value:
+            self._settings[key] = value
+            self._dirty = True
 
     def get_all(self) -> Dict[str, Any]:
         """Get all settings as a dictionary"""
@@ -171,17 +171,11 @@ class AeroflyBridge:
     async def _subscribe_to_events(self) -> None:
         """Subscribe to relevant events."""
         try:
-            # Subscribe to error events
-            await event_bus.subscribe(
-                EventType.ERROR_OCCURRED,
-                self._handle_error_event
-            )
-
-            # Subscribe to shutdown events
-            await event_bus.subscribe(
-                EventType.SHUTDOWN_REQUESTED,
-                self._handle_shutdown_event
-            )
+            # Subscribe to error and shutdown events in one batch
+            await event_bus.subscribe_many({
+                EventType.ERROR_OCCURRED: self._handle_error_event,
+                EventType.SHUTDOWN_REQUESTED: self._handle_shutdown_event,
+            })
 
             logger.debug("Subscribed to bridge events")
 
@@ -226,8 +220,8 @@ class AeroflyBridge:
             logger.warning("Aerofly Bridge not running")
             return False
 
-        # Check if already recording using the recorder's status
-        if self.get_recording_status().get('recording', {}).get('recording', False):
+        # Check if already recording
+        if self.is_recording():
             logger.warning("Already recording")
             return False
 
@@ -296,6 +290,19 @@ class AeroflyBridge:
         # Get status from flight recorder
         return self.flight_recorder.get_status()
 
+    def is_recording(self) -> bool:
+        """
+        Check whether a recording is currently in progress.
+
+        Cheap boolean predicate for hot UI paths: reads the writer's
+        recording flag directly instead of building the nested status
+        dictionaries returned by get_recording_status().
+
+        Returns:
+            bool: True if a flight is being recorded, False otherwise
+        """
+        return self.running and self.flight_recorder.igc_writer.recording
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get the overall status of the bridge and all components.
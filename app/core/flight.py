@@ -8,9 +8,18 @@ import datetime
 import json
 import os
 import math
-from typing import Dict, Any, List, Optional, Tuple, Union
+import re
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
-import statistics
+
+# Use orjson for metadata serialization when available; it is a C
+# implementation several times faster than the stdlib json module.
+# Optional, with a silent stdlib fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..data.models import XGPSData, XATTData
 from ..config.constants import METERS_TO_FEET, MPS_TO_KTS, MPS_TO_FPM
@@ -20,6 +29,46 @@ from ..io.files import get_file_info, get_igc_directory
 # Configure logger
 logger = logging.getLogger("aerofly_igc_recorder.core.flight")
 
+# Earth's radius in kilometers
+_EARTH_RADIUS_KM = 6371.0
+
+# B (fix) record layout, compiled once and applied to the whole file
+# with one findall instead of per-line startswith checks and string
+# slicing. Groups: lat deg/min/thousandths + hemisphere, lon
+# deg/min/thousandths + hemisphere, pressure and GNSS altitude. The
+# time digits and validity flag are matched but not captured — the
+# loader has never used them. The altitude fields are five characters
+# whose first may be a minus sign (%05d renders -12 as '-0012');
+# below-sea-level fixes are valid IGC and this app's own writer emits
+# them, so the pattern must accept them.
+_B_RECORD_RE = re.compile(
+    r'^B\d{6}'
+    r'(\d{2})(\d{2})(\d{3})([NS])'
+    r'(\d{3})(\d{2})(\d{3})([EW])'
+    r'.([-\d]\d{4})([-\d]\d{4})',
+    re.MULTILINE
+)
+
+# H (header) records carrying pilot/glider metadata
+_H_RECORD_RES = {
+    'pilot_name': re.compile(r'^HFPLT(.*)$', re.MULTILINE),
+    'glider_type': re.compile(r'^HFGTY(.*)$', re.MULTILINE),
+    'glider_id': re.compile(r'^HFGID(.*)$', re.MULTILINE),
+}
+
+# Labels stripped from the corresponding H record values
+_H_RECORD_LABELS = {
+    'pilot_name': 'PILOT:',
+    'glider_type': 'GLIDERTYPE:',
+    'glider_id': 'GLIDERID:',
+}
+
+# Upper bound on the in-memory position/attitude history. A multi-hour
+# session at simulator packet rates would otherwise grow the lists
+# without limit; statistics are accumulated incrementally as fixes
+# arrive, so evicting old fixes loses nothing but the raw points.
+_POSITION_HISTORY_LIMIT = 100_000
+
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -36,7 +85,7 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
         float: Distance in kilometers
     """
     # Earth's radius in kilometers
-    R = 6371.0
+    R = _EARTH_RADIUS_KM
 
     # Convert degrees to radians
     lat1_rad = math.radians(lat1)
@@ -86,9 +135,11 @@ class FlightData:
         self.start_time: Optional[datetime.datetime] = None
         self.end_time: Optional[datetime.datetime] = None
         
-        # Flight statistics
-        self.positions: List[XGPSData] = []
-        self.attitudes: List[XATTData] = []
+        # Flight statistics. Bounded deques keep memory flat on long
+        # sessions; the whole-flight statistics live in the incremental
+        # accumulators below, so eviction never skews them.
+        self.positions: Deque[XGPSData] = deque(maxlen=_POSITION_HISTORY_LIMIT)
+        self.attitudes: Deque[XATTData] = deque(maxlen=_POSITION_HISTORY_LIMIT)
         self.distance_km: float = 0.0
         self.max_altitude_meters: float = 0.0
         self.min_altitude_meters: float = 0.0
@@ -98,6 +149,22 @@ class FlightData:
         # Derived data
         self._statistics_calculated = False
         self._metadata = {}
+
+        # Incremental statistics accumulators, updated per fix in
+        # add_position so calculate_statistics is O(1) and independent
+        # of how much raw history is still retained
+        self._total_distance_km: float = 0.0
+        self._fix_count: int = 0
+        self._max_alt: float = 0.0
+        self._min_alt: float = 0.0
+        self._max_speed: float = 0.0
+        self._speed_sum: float = 0.0
+
+        # Cached trig values of the previous fix, so each incremental
+        # distance step only computes radians/cos for the new point
+        self._prev_lat_rad: Optional[float] = None
+        self._prev_lon_rad: float = 0.0
+        self._prev_cos_lat: float = 0.0
         
         # If filename is provided, load from file
         if filename and os.path.exists(filename):
@@ -120,76 +187,58 @@ class FlightData:
             # Parse IGC file
             logger.info(f"Loading flight data from IGC file: {filename}")
 
-            # Read and parse IGC file
+            # Read the whole file once and let the compiled patterns do
+            # the record scanning: one findall over the content replaces
+            # the per-line startswith checks and manual string slicing,
+            # which dominate load time on files with thousands of fixes
             with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-
-                    # Parse B records (Fix records)
-                    # Format: B HHMMSS DDMMmmmN/S DDDMMmmmE/W A PPPPP GGGGG
-                    if line.startswith('B') and len(line) >= 35:
-                        try:
-                            # Extract time
-                            time_str = line[1:7]  # HHMMSS
-                            hours = int(time_str[0:2])
-                            minutes = int(time_str[2:4])
-                            seconds = int(time_str[4:6])
-
-                            # Extract latitude
-                            lat_deg = int(line[7:9])
-                            lat_min = int(line[9:11])
-                            lat_min_dec = int(line[11:14])
-                            lat_hem = line[14]
-                            latitude = lat_deg + (lat_min + lat_min_dec / 1000.0) / 60.0
-                            if lat_hem == 'S':
-                                latitude = -latitude
-
-                            # Extract longitude
-                            lon_deg = int(line[15:18])
-                            lon_min = int(line[18:20])
-                            lon_min_dec = int(line[20:23])
-                            lon_hem = line[23]
-                            longitude = lon_deg + (lon_min + lon_min_dec / 1000.0) / 60.0
-                            if lon_hem == 'W':
-                                longitude = -longitude
-
-                            # Extract altitude (pressure altitude)
-                            pressure_alt = int(line[25:30])
-
-                            # Extract GNSS altitude (if available)
-                            gnss_alt = int(line[30:35])
-
-                            # Use GNSS altitude if available, otherwise pressure altitude
-                            altitude = gnss_alt if gnss_alt > 0 else pressure_alt
-
-                            # Create position record
-                            # Note: We don't have speed/track from IGC, so set to 0
-                            position = XGPSData(
-                                sim_name="Loaded from IGC",
-                                longitude=longitude,
-                                latitude=latitude,
-                                alt_msl_meters=altitude,
-                                track_deg=0.0,
-                                ground_speed_mps=0.0,
-                                timestamp=None  # Will be set based on file date if needed
-                            )
-
-                            self.add_position(position)
-
-                        except (ValueError, IndexError) as e:
-                            logger.debug(f"Could not parse B record: {line[:20]}... - {e}")
-                            continue
-
-                    # Parse H records (Header records) for pilot info
-                    elif line.startswith('HFPLT'):
-                        # Pilot name
-                        self.pilot_name = line[5:].strip().replace('PILOT:', '').strip()
-                    elif line.startswith('HFGTY'):
-                        # Glider type
-                        self.glider_type = line[5:].strip().replace('GLIDERTYPE:', '').strip()
-                    elif line.startswith('HFGID'):
-                        # Glider ID
-                        self.glider_id = line[5:].strip().replace('GLIDERID:', '').strip()
+                content = f.read()
+
+            # Parse B records (Fix records)
+            # Format: B HHMMSS DDMMmmmN/S DDDMMmmmE/W A PPPPP GGGGG
+            from_packet = XGPSData.from_packet
+            for (lat_deg, lat_min, lat_min_dec, lat_hem,
+                 lon_deg, lon_min, lon_min_dec, lon_hem,
+                 pressure_alt, gnss_alt) in _B_RECORD_RE.findall(content):
+                try:
+                    # The digit groups are already validated by the
+                    # pattern; fold minutes and thousandths into one
+                    # division each
+                    latitude = int(lat_deg) + (int(lat_min) * 1000 + int(lat_min_dec)) / 60000.0
+                    if lat_hem == 'S':
+                        latitude = -latitude
+
+                    longitude = int(lon_deg) + (int(lon_min) * 1000 + int(lon_min_dec)) / 60000.0
+                    if lon_hem == 'W':
+                        longitude = -longitude
+
+                    # Use GNSS altitude if available, otherwise pressure altitude
+                    altitude = int(gnss_alt)
+                    if altitude <= 0:
+                        altitude = int(pressure_alt)
+
+                    # Create position record via the fast constructor
+                    # Note: We don't have speed/track from IGC, so set to 0
+                    self.add_position(from_packet(
+                        sim_name="Loaded from IGC",
+                        longitude=longitude,
+                        latitude=latitude,
+                        alt_msl_meters=altitude,
+                        track_deg=0.0,
+                        ground_speed_mps=0.0,
+                        timestamp=None  # Will be set based on file date if needed
+                    ))
+
+                except ValueError as e:
+                    logger.debug(f"Could not parse B record: {e}")
+                    continue
+
+            # Parse H records (Header records) for pilot info
+            for attr, pattern in _H_RECORD_RES.items():
+                match = pattern.search(content)
+                if match:
+                    value = match.group(1).strip().replace(_H_RECORD_LABELS[attr], '').strip()
+                    setattr(self, attr, value)
 
             logger.info(f"Loaded {len(self.positions)} positions from IGC file")
             
@@ -234,9 +283,43 @@ class FlightData:
             if not self.end_time or position.timestamp > self.end_time:
                 self.end_time = position.timestamp
         
-        # Add to positions list
+        # Accumulate the segment distance from the previous fix. The
+        # previous point's radians and cos(lat) were cached when it
+        # arrived, so only the new point pays for trig here — half the
+        # calls of a full two-point haversine per packet.
+        lat_rad = math.radians(position.latitude)
+        lon_rad = math.radians(position.longitude)
+        cos_lat = math.cos(lat_rad)
+
+        if self._prev_lat_rad is not None:
+            a = (math.sin((lat_rad - self._prev_lat_rad) / 2)**2 +
+                 self._prev_cos_lat * cos_lat *
+                 math.sin((lon_rad - self._prev_lon_rad) / 2)**2)
+            self._total_distance_km += 2 * _EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+        self._prev_lat_rad = lat_rad
+        self._prev_lon_rad = lon_rad
+        self._prev_cos_lat = cos_lat
+
+        # Update the incremental altitude/speed accumulators
+        alt = position.alt_msl_meters
+        speed = position.ground_speed_mps
+        if self._fix_count == 0:
+            self._max_alt = self._min_alt = alt
+            self._max_speed = speed
+        else:
+            if alt > self._max_alt:
+                self._max_alt = alt
+            elif alt < self._min_alt:
+                self._min_alt = alt
+            if speed > self._max_speed:
+                self._max_speed = speed
+        self._speed_sum += speed
+        self._fix_count += 1
+
+        # Add to position history (bounded; oldest fixes are evicted)
         self.positions.append(position)
-        
+
         # Mark that statistics need to be recalculated
         self._statistics_calculated = False
 
@@ -259,36 +342,20 @@ class FlightData:
 
     def calculate_statistics(self) -> None:
         """Calculate various flight statistics from the position data."""
-        if not self.positions or len(self.positions) < 2:
+        if self._fix_count < 2:
             logger.warning("Not enough positions to calculate statistics")
             return
-            
+
         try:
-            # Calculate altitude statistics
-            altitudes = [pos.alt_msl_meters for pos in self.positions]
-            self.max_altitude_meters = max(altitudes)
-            self.min_altitude_meters = min(altitudes)
-            
-            # Calculate speed statistics
-            speeds = [pos.ground_speed_mps for pos in self.positions]
-            self.max_speed_mps = max(speeds)
-            self.avg_speed_mps = statistics.mean(speeds) if speeds else 0
-
-            # Calculate distance traveled using haversine formula
-            total_distance = 0.0
-            for i in range(len(self.positions) - 1):
-                pos1 = self.positions[i]
-                pos2 = self.positions[i + 1]
-
-                # Calculate distance between consecutive points
-                distance = haversine_distance(
-                    pos1.latitude, pos1.longitude,
-                    pos2.latitude, pos2.longitude
-                )
-                total_distance += distance
-
-            self.distance_km = total_distance
-            
+            # Everything was accumulated per fix in add_position, so
+            # this just finalizes the derived values in O(1) — no walk
+            # over the (possibly trimmed) raw history
+            self.max_altitude_meters = self._max_alt
+            self.min_altitude_meters = self._min_alt
+            self.max_speed_mps = self._max_speed
+            self.avg_speed_mps = self._speed_sum / self._fix_count
+            self.distance_km = self._total_distance_km
+
             # Mark statistics as calculated
             self._statistics_calculated = True
             
@@ -356,7 +423,9 @@ class FlightData:
             'end_time': self.end_time.isoformat() if self.end_time else None,
             'duration_seconds': self.get_duration_seconds(),
             'duration_formatted': self.get_formatted_duration(),
-            'position_count': len(self.positions),
+            # Report the number of fixes recorded, not just those still
+            # retained in the bounded history
+            'position_count': self._fix_count,
             'attitude_count': len(self.attitudes)
         }
         
@@ -398,10 +467,14 @@ class FlightData:
             
             # Convert to dictionary
             data = self.to_dict()
-            
+
             # Write to file
-            with open(metadata_filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                with open(metadata_filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(metadata_filename, 'w') as f:
+                    json.dump(data, f, indent=2)
                 
             logger.info(f"Saved flight metadata to {metadata_filename}")
             return metadata_filename
@@ -427,8 +500,12 @@ class FlightData:
                 return None
                 
             # Read JSON file
-            with open(metadata_filename, 'r') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(metadata_filename, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(metadata_filename, 'r') as f:
+                    data = json.load(f)
                 
             # Create flight data object
             flight = FlightData()
@@ -140,23 +140,13 @@ class FlightRecorder:
     async def _subscribe_to_events(self) -> None:
         """Subscribe to data received events."""
         try:
-            # Subscribe to data received events
-            await event_bus.subscribe(
-                EventType.DATA_RECEIVED,
-                self._handle_data_event
-            )
-            
-            # Subscribe to recording events to ensure proper state tracking
-            await event_bus.subscribe(
-                EventType.RECORDING_STARTED,
-                self._handle_recording_started
-            )
-            
-            await event_bus.subscribe(
-                EventType.RECORDING_STOPPED,
-                self._handle_recording_stopped
-            )
-            
+            # Subscribe to data and recording events in one batch
+            await event_bus.subscribe_many({
+                EventType.DATA_RECEIVED: self._handle_data_event,
+                EventType.RECORDING_STARTED: self._handle_recording_started,
+                EventType.RECORDING_STOPPED: self._handle_recording_stopped,
+            })
+
             logger.debug("Subscribed to flight recorder events")
             
         except Exception as e:
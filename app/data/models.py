@@ -16,11 +16,35 @@ class DataType(Enum):
     UNKNOWN = "UNKNOWN"
 
 
-@dataclass
+# Enum members bound once at module scope; data_type below resolves to
+# these via plain class-attribute lookup instead of a property call
+# plus an enum access per use
+_GPS = DataType.GPS
+_ATTITUDE = DataType.ATTITUDE
+_UNKNOWN = DataType.UNKNOWN
+
+# Their wire values, hoisted for the to_dict hot path
+_GPS_VALUE = _GPS.value
+_ATTITUDE_VALUE = _ATTITUDE.value
+_UNKNOWN_VALUE = _UNKNOWN.value
+
+# Timestamp helpers bound once: every packet without a caller-supplied
+# timestamp takes this path, and the module-level names skip two
+# attribute lookups per call
+_UTC = datetime.timezone.utc
+_now = datetime.datetime.now
+
+
+@dataclass(slots=True)
 class XGPSData:
     """
     Represents ForeFlight XGPS position data.
     Format: XGPS<sim_name>,<longitude>,<latitude>,<altitude_msl_meters>,<track_true_north>,<groundspeed_m/s>
+
+    One instance is created per UDP packet and kept for every recorded
+    fix, so slots matter here: they drop the per-instance __dict__,
+    roughly halving the memory footprint of a long flight's position
+    history and speeding up attribute access in the statistics pass.
     """
     sim_name: str
     longitude: float
@@ -57,17 +81,52 @@ class XGPSData:
 
         # Set timestamp if not provided
         if self.timestamp is None:
-            self.timestamp = datetime.datetime.now(datetime.timezone.utc)
-
-    @property
-    def data_type(self) -> DataType:
-        """Return the data type of this object"""
-        return DataType.GPS
+            self.timestamp = _now(_UTC)
+
+    @classmethod
+    def from_packet(cls,
+                    sim_name: str,
+                    longitude: float,
+                    latitude: float,
+                    alt_msl_meters: float,
+                    track_deg: float,
+                    ground_speed_mps: float,
+                    timestamp: Optional[datetime.datetime] = None) -> 'XGPSData':
+        """
+        Fast constructor for the UDP hot path.
+
+        The parser has already converted the fields with float(), so
+        the isinstance chain in __post_init__ is redundant there; this
+        keeps only the range validation (fused into one check) and
+        assigns the slots directly. Raises ValueError on out-of-range
+        values, matching __post_init__.
+        """
+        if not (-180.0 <= longitude <= 180.0 and
+                -90.0 <= latitude <= 90.0 and
+                0.0 <= track_deg <= 360.0 and
+                ground_speed_mps >= 0.0):
+            raise ValueError(f"XGPS values out of range: "
+                             f"lon={longitude}, lat={latitude}, "
+                             f"track={track_deg}, speed={ground_speed_mps}")
+
+        self = object.__new__(cls)
+        self.sim_name = sim_name
+        self.longitude = longitude
+        self.latitude = latitude
+        self.alt_msl_meters = alt_msl_meters
+        self.track_deg = track_deg
+        self.ground_speed_mps = ground_speed_mps
+        self.timestamp = timestamp or _now(_UTC)
+        return self
+
+    # Data type of this object (class attribute: cheaper than a
+    # property and identical for every instance)
+    data_type = _GPS
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the object to a dictionary"""
         return {
-            "type": self.data_type.value,
+            "type": _GPS_VALUE,
             "sim_name": self.sim_name,
             "longitude": self.longitude,
             "latitude": self.latitude,
@@ -78,7 +137,7 @@ class XGPSData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class XATTData:
     """
     Represents ForeFlight XATT attitude data.
@@ -111,17 +170,44 @@ class XATTData:
 
         # Set timestamp if not provided
         if self.timestamp is None:
-            self.timestamp = datetime.datetime.now(datetime.timezone.utc)
-
-    @property
-    def data_type(self) -> DataType:
-        """Return the data type of this object"""
-        return DataType.ATTITUDE
+            self.timestamp = _now(_UTC)
+
+    @classmethod
+    def from_packet(cls,
+                    sim_name: str,
+                    heading_deg: float,
+                    pitch_deg: float,
+                    roll_deg: float,
+                    timestamp: Optional[datetime.datetime] = None) -> 'XATTData':
+        """
+        Fast constructor for the UDP hot path.
+
+        Same contract as XGPSData.from_packet: fields are already
+        floats, so only the range validation runs before the slots are
+        assigned directly. Raises ValueError on out-of-range values.
+        """
+        if not (0.0 <= heading_deg <= 360.0 and
+                -90.0 <= pitch_deg <= 90.0 and
+                -180.0 <= roll_deg <= 180.0):
+            raise ValueError(f"XATT values out of range: "
+                             f"heading={heading_deg}, pitch={pitch_deg}, "
+                             f"roll={roll_deg}")
+
+        self = object.__new__(cls)
+        self.sim_name = sim_name
+        self.heading_deg = heading_deg
+        self.pitch_deg = pitch_deg
+        self.roll_deg = roll_deg
+        self.timestamp = timestamp or _now(_UTC)
+        return self
+
+    # Data type of this object
+    data_type = _ATTITUDE
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the object to a dictionary"""
         return {
-            "type": self.data_type.value,
+            "type": _ATTITUDE_VALUE,
             "sim_name": self.sim_name,
             "heading_deg": self.heading_deg,
             "pitch_deg": self.pitch_deg,
@@ -130,7 +216,7 @@ class XATTData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class UnknownData:
     """
     Represents unparsed or unrecognized data.
@@ -141,17 +227,15 @@ class UnknownData:
     def __post_init__(self):
         """Set timestamp if not provided"""
         if self.timestamp is None:
-            self.timestamp = datetime.datetime.now(datetime.timezone.utc)
+            self.timestamp = _now(_UTC)
 
-    @property
-    def data_type(self) -> DataType:
-        """Return the data type of this object"""
-        return DataType.UNKNOWN
+    # Data type of this object
+    data_type = _UNKNOWN
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the object to a dictionary"""
         return {
-            "type": self.data_type.value,
+            "type": _UNKNOWN_VALUE,
             "raw_line": self.raw_line,
             "timestamp": self.timestamp.isoformat() if self.timestamp else None
         }
@@ -32,20 +32,54 @@ class ForeFlightParser:
         """
         if not line:
             return UnknownData(raw_line="", timestamp=timestamp)
-            
+
         line = line.strip()
-        
+
         try:
-            if line.startswith(XGPS_PREFIX):
-                return ForeFlightParser._parse_xgps(line, timestamp)
-            elif line.startswith(XATT_PREFIX):
-                return ForeFlightParser._parse_xatt(line, timestamp)
-            else:
-                return UnknownData(raw_line=line, timestamp=timestamp)
+            # Dispatch on the 4-char prefix with one slice and one dict
+            # lookup instead of sequential startswith compares; unknown
+            # prefixes simply miss the table
+            handler = _DISPATCH.get(line[:4])
+            if handler is not None:
+                return handler(line, timestamp)
+            return UnknownData(raw_line=line, timestamp=timestamp)
         except Exception as e:
             logger.warning(f"Error parsing line: {line}. Error: {e}")
             return UnknownData(raw_line=line, timestamp=timestamp)
 
+    @staticmethod
+    def parse_bytes(buf: bytes, timestamp: Optional[datetime.datetime] = None) -> ForeFlightData:
+        """
+        Parse a raw ASCII datagram without decoding it to str first.
+
+        The UDP receiver hands the payload straight in as bytes; the
+        XGPS/XATT wire format is pure ASCII, so a full-buffer decode
+        before parsing is wasted work. float() accepts bytes slices
+        directly, and only the sim_name field is decoded at the end.
+
+        Args:
+            buf: The raw datagram bytes to parse
+            timestamp: Optional timestamp to associate with the parsed data
+
+        Returns:
+            Union[XGPSData, XATTData, UnknownData]: The parsed data object
+        """
+        if not buf:
+            return UnknownData(raw_line="", timestamp=timestamp)
+
+        buf = buf.strip()
+
+        try:
+            handler = _DISPATCH_BYTES.get(buf[:4])
+            if handler is not None:
+                return handler(buf, timestamp)
+            return UnknownData(raw_line=buf.decode('ascii', errors='ignore'),
+                               timestamp=timestamp)
+        except Exception as e:
+            logger.warning(f"Error parsing datagram: {buf!r}. Error: {e}")
+            return UnknownData(raw_line=buf.decode('ascii', errors='ignore'),
+                               timestamp=timestamp)
+
     @staticmethod
     def _parse_xgps(line: str, timestamp: Optional[datetime.datetime] = None) -> Union[XGPSData, UnknownData]:
         """
@@ -63,29 +97,43 @@ class ForeFlightParser:
             Union[XGPSData, UnknownData]: The parsed data object
         """
         try:
-            raw = line[len(XGPS_PREFIX):]  # remove 'XGPS'
-            parts = raw.split(",")
-            
-            if len(parts) < 6:
+            # Locate the five field separators with one forward scan and
+            # convert the slices directly, instead of having split
+            # allocate a list of substrings per packet
+            find = line.find
+            c1 = find(',')
+            c2 = find(',', c1 + 1) if c1 != -1 else -1
+            c3 = find(',', c2 + 1) if c2 != -1 else -1
+            c4 = find(',', c3 + 1) if c3 != -1 else -1
+            c5 = find(',', c4 + 1) if c4 != -1 else -1
+
+            if c5 == -1:
                 logger.warning(f"Invalid XGPS data format (not enough parts): {line}")
                 return UnknownData(raw_line=line, timestamp=timestamp)
-                
-            sim_name = parts[0].strip()
-            
+
+            sim_name = line[len(XGPS_PREFIX):c1].strip()
+
+            # The last field ends at the next comma if trailing fields
+            # exist, otherwise at the end of the line
+            c6 = find(',', c5 + 1)
+            end = c6 if c6 != -1 else len(line)
+
             # Parse numeric values, handling potential errors
             try:
-                longitude = float(parts[1])
-                latitude = float(parts[2])
-                alt_msl_meters = float(parts[3])
-                track_deg = float(parts[4])
-                ground_speed_mps = float(parts[5])
+                longitude = float(line[c1 + 1:c2])
+                latitude = float(line[c2 + 1:c3])
+                alt_msl_meters = float(line[c3 + 1:c4])
+                track_deg = float(line[c4 + 1:c5])
+                ground_speed_mps = float(line[c5 + 1:end])
             except ValueError as e:
                 logger.warning(f"Invalid numeric value in XGPS data: {line}. Error: {e}")
                 return UnknownData(raw_line=line, timestamp=timestamp)
 
-            # Create and return the XGPSData object
+            # Create and return the XGPSData object. from_packet skips
+            # the redundant type checks since the fields above are
+            # already floats, keeping only the range validation.
             try:
-                return XGPSData(
+                return XGPSData.from_packet(
                     sim_name=sim_name,
                     longitude=longitude,
                     latitude=latitude,
@@ -119,27 +167,34 @@ class ForeFlightParser:
             Union[XATTData, UnknownData]: The parsed data object
         """
         try:
-            raw = line[len(XATT_PREFIX):]  # remove 'XATT'
-            parts = raw.split(",")
-            
-            if len(parts) < 4:
+            # Same single-scan field extraction as the XGPS path
+            find = line.find
+            c1 = find(',')
+            c2 = find(',', c1 + 1) if c1 != -1 else -1
+            c3 = find(',', c2 + 1) if c2 != -1 else -1
+
+            if c3 == -1:
                 logger.warning(f"Invalid XATT data format (not enough parts): {line}")
                 return UnknownData(raw_line=line, timestamp=timestamp)
-                
-            sim_name = parts[0].strip()
-            
+
+            sim_name = line[len(XATT_PREFIX):c1].strip()
+
+            c4 = find(',', c3 + 1)
+            end = c4 if c4 != -1 else len(line)
+
             # Parse numeric values, handling potential errors
             try:
-                heading_deg = float(parts[1])
-                pitch_deg = float(parts[2])
-                roll_deg = float(parts[3])
+                heading_deg = float(line[c1 + 1:c2])
+                pitch_deg = float(line[c2 + 1:c3])
+                roll_deg = float(line[c3 + 1:end])
             except ValueError as e:
                 logger.warning(f"Invalid numeric value in XATT data: {line}. Error: {e}")
                 return UnknownData(raw_line=line, timestamp=timestamp)
 
-            # Create and return the XATTData object
+            # Create and return the XATTData object via the same fast
+            # path as XGPS
             try:
-                return XATTData(
+                return XATTData.from_packet(
                     sim_name=sim_name,
                     heading_deg=heading_deg,
                     pitch_deg=pitch_deg,
@@ -154,6 +209,122 @@ class ForeFlightParser:
             logger.warning(f"Unexpected error parsing XATT data: {e}")
             return UnknownData(raw_line=line, timestamp=timestamp)
 
+    @staticmethod
+    def _parse_xgps_bytes(buf: bytes, timestamp: Optional[datetime.datetime] = None) -> Union[XGPSData, UnknownData]:
+        """
+        Bytes twin of _parse_xgps for the zero-copy UDP path.
+
+        Same single-scan field extraction; the numeric slices are fed
+        to float() as bytes and only sim_name pays for a decode.
+        """
+        try:
+            find = buf.find
+            c1 = find(b',')
+            c2 = find(b',', c1 + 1) if c1 != -1 else -1
+            c3 = find(b',', c2 + 1) if c2 != -1 else -1
+            c4 = find(b',', c3 + 1) if c3 != -1 else -1
+            c5 = find(b',', c4 + 1) if c4 != -1 else -1
+
+            if c5 == -1:
+                logger.warning(f"Invalid XGPS data format (not enough parts): {buf!r}")
+                return UnknownData(raw_line=buf.decode('ascii', errors='ignore'),
+                                   timestamp=timestamp)
+
+            sim_name = buf[len(XGPS_PREFIX):c1].decode('ascii', errors='ignore').strip()
+
+            c6 = find(b',', c5 + 1)
+            end = c6 if c6 != -1 else len(buf)
+
+            try:
+                longitude = float(buf[c1 + 1:c2])
+                latitude = float(buf[c2 + 1:c3])
+                alt_msl_meters = float(buf[c3 + 1:c4])
+                track_deg = float(buf[c4 + 1:c5])
+                ground_speed_mps = float(buf[c5 + 1:end])
+            except ValueError as e:
+                logger.warning(f"Invalid numeric value in XGPS data: {buf!r}. Error: {e}")
+                return UnknownData(raw_line=buf.decode('ascii', errors='ignore'),
+                                   timestamp=timestamp)
+
+            try:
+                return XGPSData.from_packet(
+                    sim_name=sim_name,
+                    longitude=longitude,
+                    latitude=latitude,
+                    alt_msl_meters=alt_msl_meters,
+                    track_deg=track_deg,
+                    ground_speed_mps=ground_speed_mps,
+                    timestamp=timestamp
+                )
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Error creating XGPSData: {e}")
+                return UnknownData(raw_line=buf.decode('ascii', errors='ignore'),
+                                   timestamp=timestamp)
+
+        except Exception as e:
+            logger.warning(f"Unexpected error parsing XGPS data: {e}")
+            return UnknownData(raw_line=buf.decode('ascii', errors='ignore'),
+                               timestamp=timestamp)
+
+    @staticmethod
+    def _parse_xatt_bytes(buf: bytes, timestamp: Optional[datetime.datetime] = None) -> Union[XATTData, UnknownData]:
+        """
+        Bytes twin of _parse_xatt for the zero-copy UDP path.
+        """
+        try:
+            find = buf.find
+            c1 = find(b',')
+            c2 = find(b',', c1 + 1) if c1 != -1 else -1
+            c3 = find(b',', c2 + 1) if c2 != -1 else -1
+
+            if c3 == -1:
+                logger.warning(f"Invalid XATT data format (not enough parts): {buf!r}")
+                return UnknownData(raw_line=buf.decode('ascii', errors='ignore'),
+                                   timestamp=timestamp)
+
+            sim_name = buf[len(XATT_PREFIX):c1].decode('ascii', errors='ignore').strip()
+
+            c4 = find(b',', c3 + 1)
+            end = c4 if c4 != -1 else len(buf)
+
+            try:
+                heading_deg = float(buf[c1 + 1:c2])
+                pitch_deg = float(buf[c2 + 1:c3])
+                roll_deg = float(buf[c3 + 1:end])
+            except ValueError as e:
+                logger.warning(f"Invalid numeric value in XATT data: {buf!r}. Error: {e}")
+                return UnknownData(raw_line=buf.decode('ascii', errors='ignore'),
+                                   timestamp=timestamp)
+
+            try:
+                return XATTData.from_packet(
+                    sim_name=sim_name,
+                    heading_deg=heading_deg,
+                    pitch_deg=pitch_deg,
+                    roll_deg=roll_deg,
+                    timestamp=timestamp
+                )
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Error creating XATTData: {e}")
+                return UnknownData(raw_line=buf.decode('ascii', errors='ignore'),
+                                   timestamp=timestamp)
+
+        except Exception as e:
+            logger.warning(f"Unexpected error parsing XATT data: {e}")
+            return UnknownData(raw_line=buf.decode('ascii', errors='ignore'),
+                               timestamp=timestamp)
+
+
+# Prefix-to-handler dispatch tables, built once at import
+_DISPATCH = {
+    XGPS_PREFIX: ForeFlightParser._parse_xgps,
+    XATT_PREFIX: ForeFlightParser._parse_xatt,
+}
+
+_DISPATCH_BYTES = {
+    XGPS_PREFIX.encode('ascii'): ForeFlightParser._parse_xgps_bytes,
+    XATT_PREFIX.encode('ascii'): ForeFlightParser._parse_xatt_bytes,
+}
 
 # Create a singleton instance of the parser
 parser = ForeFlightParser()
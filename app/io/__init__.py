@@ -6,9 +6,10 @@ Contains modules for UDP communication and file I/O operations.
 from .udp import UDPServer, create_udp_server
 from .igc import IGCWriter, create_igc_writer
 from .files import (
-    get_igc_directory, 
-    list_igc_files, 
-    get_file_info, 
+    get_igc_directory,
+    list_igc_files,
+    list_igc_file_entries,
+    get_file_info,
     open_file_or_directory,
     delete_file, 
     copy_file, 
@@ -22,9 +23,10 @@ __all__ = [
     'create_udp_server',
     'IGCWriter', 
     'create_igc_writer',
-    'get_igc_directory', 
-    'list_igc_files', 
-    'get_file_info', 
+    'get_igc_directory',
+    'list_igc_files',
+    'list_igc_file_entries',
+    'get_file_info',
     'open_file_or_directory',
     'delete_file', 
     'copy_file', 
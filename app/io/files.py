@@ -6,7 +6,7 @@ import os
 import logging
 import datetime
 import shutil
-import glob
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict, Any
 import sys
@@ -16,6 +16,46 @@ from ..config.settings import settings
 # Configure logger
 logger = logging.getLogger("aerofly_igc_recorder.io.files")
 
+# Maximum number of missing paths remembered by the negative stat cache
+_NEG_CACHE_MAX_SIZE = 128
+
+# Negative stat cache: paths recently observed to be missing.
+# The UI repeatedly probes the same non-existent paths (file operations,
+# unique filename generation), and every miss costs a syscall. Remembering
+# misses lets us skip the repeat probes. Entries are evicted (LRU) when the
+# cache is full and whenever a path is created through this module.
+_neg_stat_cache: "OrderedDict[str, None]" = OrderedDict()
+
+
+def _exists(path: str) -> bool:
+    """
+    Check whether a path exists, using the negative stat cache to
+    short-circuit repeated probes of paths known to be missing.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        bool: True if the path exists, False otherwise
+    """
+    if path in _neg_stat_cache:
+        _neg_stat_cache.move_to_end(path)
+        return False
+
+    if os.path.exists(path):
+        return True
+
+    # Remember the miss, evicting the least recently used entry if full
+    _neg_stat_cache[path] = None
+    if len(_neg_stat_cache) > _NEG_CACHE_MAX_SIZE:
+        _neg_stat_cache.popitem(last=False)
+    return False
+
+
+def _forget_missing(path: str) -> None:
+    """Evict a path from the negative stat cache after it has been created."""
+    _neg_stat_cache.pop(path, None)
+
 
 def get_igc_directory() -> str:
     """
@@ -38,24 +78,61 @@ def list_igc_files(directory: Optional[str] = None) -> List[str]:
         directory: Directory to search (default: from settings)
 
     Returns:
-        List[str]: List of IGC file paths
+        List[str]: List of IGC file paths, newest first
+    """
+    return [entry['path'] for entry in list_igc_file_entries(directory)]
+
+
+def list_igc_file_entries(directory: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    List all IGC files in a directory with their size and modification
+    time gathered in a single scandir pass. DirEntry caches the stat
+    result, so each file costs one syscall instead of the separate
+    glob + getmtime + stat round-trips of per-file get_file_info calls.
+
+    Args:
+        directory: Directory to search (default: from settings)
+
+    Returns:
+        List[Dict[str, Any]]: One dict per file with 'path', 'filename',
+            'size_bytes', 'size_str' and 'modified_ts', newest first
     """
     if directory is None:
         directory = get_igc_directory()
 
     try:
-        # Use glob to find all .igc files
-        igc_files = glob.glob(os.path.join(directory, "*.igc"))
+        entries = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.lower().endswith('.igc'):
+                    stat = entry.stat()
+                    entries.append({
+                        'path': entry.path,
+                        'filename': entry.name,
+                        'size_bytes': stat.st_size,
+                        'size_str': _format_size(stat.st_size),
+                        'modified_ts': stat.st_mtime
+                    })
 
         # Sort by modification time (newest first)
-        igc_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+        entries.sort(key=lambda e: e['modified_ts'], reverse=True)
 
-        return igc_files
+        return entries
     except Exception as e:
         logger.error(f"Error listing IGC files: {e}")
         return []
 
 
+def _format_size(size_bytes: int) -> str:
+    """Format a file size in bytes as a human-readable string."""
+    if size_bytes < 1024:
+        return f"{size_bytes} bytes"
+    elif size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    else:
+        return f"{size_bytes / (1024 * 1024):.1f} MB"
+
+
 def get_file_info(filepath: str) -> Dict[str, Any]:
     """
     Get information about a file.
@@ -78,14 +155,7 @@ def get_file_info(filepath: str) -> Dict[str, Any]:
 
         # Get file size
         size_bytes = stat.st_size
-
-        # Format size
-        if size_bytes < 1024:
-            size_str = f"{size_bytes} bytes"
-        elif size_bytes < 1024 * 1024:
-            size_str = f"{size_bytes / 1024:.1f} KB"
-        else:
-            size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
+        size_str = _format_size(size_bytes)
 
         return {
             'exists': True,
@@ -96,6 +166,7 @@ def get_file_info(filepath: str) -> Dict[str, Any]:
             'size_str': size_str,
             'created': ctime.isoformat(),
             'modified': mtime.isoformat(),
+            'modified_ts': stat.st_mtime,
             'extension': os.path.splitext(filepath)[1].lower()
         }
     except Exception as e:
@@ -147,7 +218,7 @@ def delete_file(filepath: str) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        if not os.path.exists(filepath):
+        if not _exists(filepath):
             logger.warning(f"File not found: {filepath}")
             return False
 
@@ -172,15 +243,16 @@ def copy_file(source: str, destination: str, overwrite: bool = False) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        if not os.path.exists(source):
+        if not _exists(source):
             logger.error(f"Source file not found: {source}")
             return False
 
-        if os.path.exists(destination) and not overwrite:
+        if _exists(destination) and not overwrite:
             logger.warning(f"Destination exists and overwrite not allowed: {destination}")
             return False
 
         shutil.copy2(source, destination)
+        _forget_missing(destination)
         logger.info(f"Copied {source} to {destination}")
         return True
     except Exception as e:
@@ -200,18 +272,19 @@ def rename_file(filepath: str, new_name: str) -> Optional[str]:
         Optional[str]: New filepath if successful, None otherwise
     """
     try:
-        if not os.path.exists(filepath):
+        if not _exists(filepath):
             logger.error(f"File not found: {filepath}")
             return None
 
         directory = os.path.dirname(filepath)
         new_filepath = os.path.join(directory, new_name)
 
-        if os.path.exists(new_filepath):
+        if _exists(new_filepath):
             logger.error(f"Destination already exists: {new_filepath}")
             return None
 
         os.rename(filepath, new_filepath)
+        _forget_missing(new_filepath)
         logger.info(f"Renamed {filepath} to {new_filepath}")
         return new_filepath
     except Exception as e:
@@ -273,8 +346,12 @@ def get_available_filename(base_path: str, extension: str = ".igc") -> str:
     filepath = os.path.join(directory, f"{basename}{extension}")
 
     # If it exists, add counter until we find an available name
-    while os.path.exists(filepath):
+    while _exists(filepath):
         filepath = os.path.join(directory, f"{basename}_{counter}{extension}")
         counter += 1
 
+    # The caller is expected to create this file, so drop it from the
+    # negative cache to keep subsequent probes accurate
+    _forget_missing(filepath)
+
     return filepath
\ No newline at end of file
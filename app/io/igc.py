@@ -4,8 +4,10 @@ Handles writing flight data to IGC files using the aerofiles library.
 """
 
 import os
+import time
 import logging
 import datetime
+from collections import deque
 from typing import Optional, Dict, List, Any, TextIO, Union
 from pathlib import Path
 import asyncio
@@ -28,11 +30,22 @@ from ..config.gliders_module import get_igc_glider_info
 # Configure logger
 logger = logging.getLogger("aerofly_igc_recorder.io.igc")
 
+# Batching parameters for the background flusher: pending fixes are written
+# out every interval, or sooner once enough of them have accumulated
+FLUSH_INTERVAL_SECONDS = 1.0
+FLUSH_BATCH_SIZE = 64
+
 
 class IGCWriter:
     """
     Handles writing flight data to IGC files.
     Uses aerofiles library for IGC format compliance.
+
+    Concurrency model: add_position is lock-free — it only appends to the
+    pending deque and wakes the flusher, so the per-fix hot path never pays
+    for lock acquisition. The writer and file are owned exclusively by the
+    background flusher; self._lock serializes only the start/stop
+    transitions and batch drains.
     """
 
     def __init__(self):
@@ -43,6 +56,7 @@ class IGCWriter:
     def reset(self):
         """Reset the writer state."""
         self.file = None
+        self._fd = None
         self.writer = None
         self.filename = None
         self.pilot_name = None
@@ -52,9 +66,21 @@ class IGCWriter:
         self.recording = False
         self.start_time = None
         self.end_time = None
+        self._start_mono_ns = 0
         self.fix_count = 0
         self.second_counter = 0
 
+        # Pending fixes waiting to be written; drained in batches by the
+        # background flusher so each fix doesn't pay its own lock+write cycle
+        self._pending = deque()
+        self._flush_event = asyncio.Event()
+        self._flusher_task = None
+
+        # Scratch buffer for B records: the record is fixed-width, so each
+        # fix mutates this template in place instead of allocating and
+        # encoding a fresh string (see _fill_b_record for the layout)
+        self._b_rec = bytearray(b"B0000000000000N00000000EA0000000000050000\r\n")
+
     async def start_recording(self, 
                        pilot_name: str = "", 
                        glider_type: str = "", 
@@ -83,41 +109,40 @@ class IGCWriter:
                 # Get the output directory
                 if igc_directory is None:
                     igc_directory = settings.get('igc_directory')
-                    
-                # Create the directory if it doesn't exist
-                os.makedirs(igc_directory, exist_ok=True)
-                
+
                 # Generate filename
                 self.filename = os.path.join(igc_directory, self._generate_filename())
-                
+
                 # Store metadata
                 self.pilot_name = pilot_name or settings.get('default_pilot_name', "Simulator Pilot")
                 self.glider_type = glider_type or settings.get('default_glider_type', "Aerofly FS4")
                 self.glider_id = glider_id or settings.get('default_glider_id', "SIM")
                 self.glider_info = glider_info or {}
-                
-                # Open file for writing in binary mode (required by aerofiles)
-                self.file = open(self.filename, 'wb')
-                
-                # Create aerofiles IGC writer
-                self.writer = Writer(self.file)
-                
-                # Get current time as UTC
+
+                # Get current time as UTC, plus a monotonic anchor so
+                # status durations use cheap integer arithmetic and are
+                # immune to wall-clock adjustments
                 self.start_time = datetime.datetime.now(datetime.timezone.utc)
-                
+                self._start_mono_ns = time.monotonic_ns()
+
                 # Initialize seconds counter for time simulation
                 self.second_counter = 0
-                
-                # Write IGC header records
-                self._write_header()
-                
+
+                # Create the directory, open the file, and write headers in
+                # a worker thread — directory metadata ops and the dozen
+                # small header writes would otherwise block the event loop
+                await asyncio.to_thread(self._bootstrap_file, igc_directory)
+
                 # Reset fix count
                 self.fix_count = 0
                 
                 # Set recording flag
                 self.recording = True
-                
-                logger.info(f"Started recording IGC file: {self.filename}")
+
+                # Start the background flusher that drains queued fixes
+                self._flusher_task = asyncio.create_task(self._flush_loop())
+
+                logger.info("Started recording IGC file: %s", self.filename)
                 
                 # Publish event
                 await publish_event(
@@ -135,7 +160,7 @@ class IGCWriter:
                 return self.filename
                 
             except Exception as e:
-                logger.error(f"Error starting IGC recording: {e}")
+                logger.error("Error starting IGC recording: %s", e)
                 
                 # Clean up if error occurs
                 if hasattr(self, 'file') and self.file:
@@ -170,7 +195,19 @@ class IGCWriter:
             try:
                 # Set end time
                 self.end_time = datetime.datetime.now(datetime.timezone.utc)
-                
+
+                # Stop the background flusher
+                if self._flusher_task and not self._flusher_task.done():
+                    self._flusher_task.cancel()
+                    try:
+                        await self._flusher_task
+                    except asyncio.CancelledError:
+                        pass
+                self._flusher_task = None
+
+                # Write any fixes still waiting in the queue
+                await self._drain_pending()
+
                 # Write final comments
                 if self.writer:
                     try:
@@ -179,16 +216,18 @@ class IGCWriter:
                             f"Recording ended at {self.end_time.strftime('%H:%M:%S')}"
                         )
                     except Exception as e:
-                        logger.error(f"Error writing end comment: {e}")
+                        logger.error("Error writing end comment: %s", e)
                 
-                # Close the file
+                # Flush and close the file off the event loop; with the large
+                # write buffer this is where most of the data hits the disk
                 if self.file:
-                    self.file.close()
+                    await asyncio.to_thread(self.file.flush)
+                    await asyncio.to_thread(self.file.close)
                     self.file = None
                 
                 # Check if any fixes were recorded
                 if self.fix_count > 0:
-                    logger.info(f"Stopped recording. Wrote {self.fix_count} fixes to {self.filename}")
+                    logger.info("Stopped recording. Wrote %d fixes to %s", self.fix_count, self.filename)
                     
                     # Store the filename before resetting
                     result_file = self.filename
@@ -233,7 +272,7 @@ class IGCWriter:
                     return None
                     
             except Exception as e:
-                logger.error(f"Error stopping IGC recording: {e}")
+                logger.error("Error stopping IGC recording: %s", e)
                 
                 # Clean up even if error occurs
                 if self.file:
@@ -273,81 +312,222 @@ class IGCWriter:
         Returns:
             bool: True if position was added successfully, False otherwise
         """
-        async with self._lock:
-            if not self.recording or not self.file or not self.writer:
-                return False
-                
-            try:
-                # Extract data from GPS
-                latitude = gps_data.latitude
-                longitude = gps_data.longitude
-                altitude = int(gps_data.alt_msl_meters)  # IGC uses meters
-                
-                # Get pressure altitude (we don't have this in simulator, use MSL as approximation)
-                pressure_alt = altitude
-                
-                # For screen display, continue incrementing the seconds
-                self.second_counter += 1
-                
-                # Calculate hours, minutes, and seconds properly
-                total_seconds = self.second_counter
-                hours = 12  # Start at 12:00:00
-                minutes = (total_seconds // 60) % 60
-                seconds = total_seconds % 60
-                
-                # Create a properly incremented time
-                simulated_time = datetime.time(
-                    hour=hours,
-                    minute=minutes,
-                    second=seconds,
-                    microsecond=0
-                )
-                
-                # Write B record (position fix) using aerofiles
-                self.writer.write_fix(
-                    time=simulated_time,  # Use simulated time that increases properly
-                    latitude=latitude,
-                    longitude=longitude,
-                    valid=True,  # Mark as valid GPS fix
-                    pressure_alt=pressure_alt,
-                    gps_alt=altitude,
-                    extensions = [50, 0]  # Optional extensions (e.g., GPS quality)
-                )
-                
-                # Increment fix count
-                self.fix_count += 1
-                
-                # Publish event (at a reduced rate to avoid flooding)
-                if self.fix_count % 10 == 0:  # Only publish every 10th position
+        if not self.recording or not self.file or not self.writer:
+            return False
+
+        try:
+            # Extract data from GPS
+            latitude = gps_data.latitude
+            longitude = gps_data.longitude
+            altitude = int(gps_data.alt_msl_meters)  # IGC uses meters
+
+            # For screen display, continue incrementing the seconds
+            self.second_counter += 1
+
+            # Calculate hours, minutes, and seconds properly
+            total_seconds = self.second_counter
+            hours = 12  # Start at 12:00:00
+            minutes = (total_seconds // 60) % 60
+            seconds = total_seconds % 60
+
+            # Create a properly incremented time
+            simulated_time = datetime.time(
+                hour=hours,
+                minute=minutes,
+                second=seconds,
+                microsecond=0
+            )
+
+            # Queue the fix for the background flusher instead of paying a
+            # lock+format+write cycle per fix; wake the flusher early once
+            # enough fixes have accumulated
+            self._pending.append((simulated_time, latitude, longitude, altitude))
+            if len(self._pending) >= FLUSH_BATCH_SIZE:
+                self._flush_event.set()
+
+            # Increment fix count
+            self.fix_count += 1
+
+            # Publish event (at a reduced rate to avoid flooding)
+            if self.fix_count % 10 == 0:  # Only publish every 10th position
+                # Build a fresh payload per publish: delivery is
+                # fire-and-forget and async subscribers conflate events
+                # in a queue, so a reused dict could be overwritten by a
+                # later fix before an earlier publish is observed
+                asyncio.create_task(publish_event(
+                    EventType.POSITION_ADDED,
+                    {
+                        'fix_count': self.fix_count,
+                        'position': {
+                            'latitude': latitude,
+                            'longitude': longitude,
+                            'altitude': altitude
+                        }
+                    },
+                    'IGCWriter'
+                ))
+
+            return True
+
+        except Exception as e:
+            logger.error("Error adding position to IGC file: %s", e)
+
+            # Publish error event
+            await publish_event(
+                EventType.ERROR_OCCURRED,
+                {
+                    'message': f"Error adding position to IGC file: {str(e)}",
+                    'component': 'IGCWriter'
+                },
+                'IGCWriter'
+            )
+
+            return False
+
+    async def _flush_loop(self) -> None:
+        """
+        Background task that drains queued fixes in batches.
+        Wakes up every FLUSH_INTERVAL_SECONDS, or earlier when
+        FLUSH_BATCH_SIZE fixes have accumulated.
+        """
+        flush_event = self._flush_event
+        try:
+            while self.recording:
+                try:
+                    await asyncio.wait_for(
+                        flush_event.wait(),
+                        timeout=FLUSH_INTERVAL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+                flush_event.clear()
+
+                # Guard each drain individually: a failed write (disk
+                # full, file yanked) must not kill the flusher while
+                # recording stays True, or fixes would silently pile up
+                # in _pending forever. Surface the error and keep going
+                # so the next batch gets another chance.
+                try:
+                    async with self._lock:
+                        if not self.recording:
+                            break
+                        await self._drain_pending()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error("Error writing IGC fix batch: %s", e)
                     await publish_event(
-                        EventType.POSITION_ADDED,
+                        EventType.ERROR_OCCURRED,
                         {
-                            'fix_count': self.fix_count,
-                            'position': {
-                                'latitude': latitude,
-                                'longitude': longitude,
-                                'altitude': altitude
-                            }
+                            'message': f"Error writing IGC fixes: {str(e)}",
+                            'component': 'IGCWriter'
                         },
                         'IGCWriter'
                     )
-                
-                return True
-                
-            except Exception as e:
-                logger.error(f"Error adding position to IGC file: {e}")
-                
-                # Publish error event
-                await publish_event(
-                    EventType.ERROR_OCCURRED,
-                    {
-                        'message': f"Error adding position to IGC file: {str(e)}",
-                        'component': 'IGCWriter'
-                    },
-                    'IGCWriter'
-                )
-                
-                return False
+
+        except asyncio.CancelledError:
+            logger.debug("IGC flush loop cancelled")
+            raise
+
+    async def _drain_pending(self) -> None:
+        """
+        Write all queued fixes to the file in one batch.
+        Must be called with self._lock held.
+        """
+        if not self._pending or self._fd is None:
+            return
+
+        batch = []
+        pending = self._pending
+        while pending:
+            batch.append(pending.popleft())
+
+        await asyncio.to_thread(self._write_batch, batch)
+
+    def _fill_b_record(self,
+                       fix_time: datetime.time,
+                       latitude: float,
+                       longitude: float,
+                       altitude: int) -> bytearray:
+        """
+        Fill the preallocated B record scratch buffer with a position fix.
+
+        The B record is a fixed-width format, so we emit it directly
+        instead of going through aerofiles' write_fix, which re-validates
+        and re-formats every field on each call. Mutating the template in
+        place also skips a per-fix string allocation and ASCII encode.
+        The output matches what aerofiles produces for the fix extensions
+        declared in the header (FXA=050, ENL=000); aerofiles is still
+        used for header records.
+
+        Layout: B HHMMSS DDMMmmmN/S DDDMMmmmE/W A PPPPP GGGGG FXA ENL
+        """
+        rec = self._b_rec
+
+        rec[1:7] = b'%02d%02d%02d' % (
+            fix_time.hour, fix_time.minute, fix_time.second
+        )
+
+        lat_abs = abs(latitude)
+        lat_deg = int(lat_abs)
+        rec[7:14] = b'%02d%05d' % (lat_deg, round((lat_abs - lat_deg) * 60000))
+        rec[14] = 0x53 if latitude < 0 else 0x4E  # 'S' / 'N'
+
+        lon_abs = abs(longitude)
+        lon_deg = int(lon_abs)
+        rec[15:23] = b'%03d%05d' % (lon_deg, round((lon_abs - lon_deg) * 60000))
+        rec[23] = 0x57 if longitude < 0 else 0x45  # 'W' / 'E'
+
+        # No pressure altitude in simulator, use MSL for both fields
+        rec[25:35] = b'%05d%05d' % (altitude, altitude)
+
+        return rec
+
+    def _write_batch(self, batch) -> None:
+        """
+        Write a batch of queued fixes with a single os.write on the raw
+        file descriptor. Serializing the whole batch into one buffer
+        first skips the BufferedWriter lock per record and costs exactly
+        one syscall per flush.
+        """
+        buf = bytearray()
+        fill_b_record = self._fill_b_record
+        for fix_time, latitude, longitude, altitude in batch:
+            buf += fill_b_record(fix_time, latitude, longitude, altitude)
+        os.write(self._fd, buf)
+
+    def _bootstrap_file(self, igc_directory: str) -> None:
+        """
+        Create the output directory, open the IGC file, and write the
+        header records. Runs in a worker thread via asyncio.to_thread so
+        the blocking filesystem work stays off the event loop.
+
+        Args:
+            igc_directory: Directory where the IGC file will be created
+        """
+        # Create the directory if it doesn't exist
+        os.makedirs(igc_directory, exist_ok=True)
+
+        # Open file for writing in binary mode (required by aerofiles)
+        # with a large userspace buffer so per-fix writes don't each
+        # hit the disk with a small syscall
+        self.file = open(self.filename, 'wb', buffering=1024 * 1024)
+
+        # Create aerofiles IGC writer
+        self.writer = Writer(self.file)
+
+        # Write IGC header records
+        self._write_header()
+
+        # Flush the headers and keep the raw descriptor: B record batches
+        # bypass the BufferedWriter (and its per-write lock) and go out
+        # with a single os.write syscall per batch. The buffered file and
+        # the raw fd share one file offset, so the interleaving is safe as
+        # long as buffered data is flushed before raw writes — which it is
+        # here and again before the END comment in stop_recording.
+        self.file.flush()
+        self._fd = self.file.fileno()
 
     def _write_header(self) -> bool:
         """
@@ -408,7 +588,7 @@ class IGCWriter:
             return True
             
         except Exception as e:
-            logger.error(f"Error writing IGC header: {e}")
+            logger.error("Error writing IGC header: %s", e)
             return False
 
     def _generate_filename(self) -> str:
@@ -440,12 +620,14 @@ class IGCWriter:
             status['glider_id'] = self.glider_id
             
             if self.start_time:
-                current_time = datetime.datetime.now(datetime.timezone.utc)
-                duration = current_time - self.start_time
-                status['duration_seconds'] = duration.total_seconds()
-                hours, remainder = divmod(duration.total_seconds(), 3600)
+                # Integer arithmetic on the monotonic anchor instead of
+                # datetime subtraction and timedelta allocation; status
+                # is polled several times a second by the UI
+                total_seconds = (time.monotonic_ns() - self._start_mono_ns) // 1_000_000_000
+                status['duration_seconds'] = total_seconds
+                hours, remainder = divmod(total_seconds, 3600)
                 minutes, seconds = divmod(remainder, 60)
-                status['duration_formatted'] = f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}"
+                status['duration_formatted'] = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
                 status['start_time'] = self.start_time.isoformat()
                 
         return status
@@ -12,13 +12,36 @@ import datetime
 
 from ..data.models import ForeFlightData
 from ..data.parser import ForeFlightParser
-from ..config.constants import DEFAULT_UDP_PORT, DEFAULT_BUFFER_SIZE, DEFAULT_ENCODING
+from ..config.constants import DEFAULT_UDP_PORT, UDP_RECEIVE_BUFFER_BYTES
 from ..config.settings import settings
 from ..utils.events import EventType, publish_event, event_bus
 
 # Configure logger
 logger = logging.getLogger("aerofly_igc_recorder.io.udp")
 
+# Only every Nth packet is published as a DATA_RECEIVED event; subscribers
+# use the events as a telemetry summary, so they don't need every datagram
+DATA_EVENT_SAMPLE_RATE = 5
+
+
+class _AeroflyDatagramProtocol(asyncio.DatagramProtocol):
+    """
+    asyncio datagram protocol that forwards received packets to the
+    owning UDPServer. Packets are delivered directly by the event loop
+    selector, avoiding a thread-pool hop per datagram.
+    """
+
+    def __init__(self, server: 'UDPServer'):
+        self.server = server
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        """Handle an incoming datagram by scheduling async processing."""
+        asyncio.create_task(self.server._process_data(data, addr))
+
+    def error_received(self, exc: Exception) -> None:
+        """Handle transport-level errors."""
+        logger.error("UDP transport error: %s", exc)
+
 
 class UDPServer:
     """
@@ -36,16 +59,45 @@ class UDPServer:
         """
         self.parser = parser
         self.port = port or settings.get('udp_port', DEFAULT_UDP_PORT)
+
+        # Cached at construction so hot status polls don't re-hash the
+        # settings dict on every has_connection check; changing the
+        # timeout requires restarting the server
+        self._connection_timeout = float(settings.get('connection_timeout', 5.0))
+
         self.socket = None
-        self.receive_task = None
+        self.transport = None
+        self.protocol = None
         self.running = False
         self.last_data_time = None
-        
+
         # Keep track of latest data received
         self.latest_gps_data = None
         self.latest_att_data = None
+
+        # Packet counter used to sample DATA_RECEIVED event publishes
+        self._pkt_counter = 0
+
+        # Per-second timestamp cache: packets arriving within the same
+        # wall-clock second share one datetime object instead of paying a
+        # datetime.now(timezone.utc) construction per packet
+        self._ts_cache_second = -1
+        self._ts_cache: Optional[datetime.datetime] = None
+
+        # Persistent status dict returned by get_connection_status; the UI
+        # polls status several times a second, so mutate one dict in place
+        # instead of rebuilding the nested structure on every call
+        self._status = {
+            'running': False,
+            'port': self.port,
+            'has_connection': False,
+            'has_gps_data': False,
+            'has_attitude_data': False
+        }
+        self._status_gps_id = None
+        self._status_att_id = None
         
-        logger.info(f"UDP Server initialized on port {self.port}")
+        logger.info("UDP Server initialized on port %s", self.port)
 
     async def start(self) -> bool:
         """
@@ -65,18 +117,34 @@ class UDPServer:
             # Enable broadcast & address reuse
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+            # Enlarge the kernel receive buffer so packet bursts (e.g. the
+            # sim catching up after a stall) queue instead of dropping.
+            # Best effort: the kernel may clamp the value.
+            try:
+                self.socket.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RECEIVE_BUFFER_BYTES
+                )
+            except OSError as e:
+                logger.debug("Could not set SO_RCVBUF: %s", e)
             
-            # Set blocking to True since we'll run in a separate task
-            self.socket.setblocking(True)
-            
+            # Set non-blocking mode as required by the asyncio transport
+            self.socket.setblocking(False)
+
             # Bind to all interfaces on the specified port
             self.socket.bind(('0.0.0.0', self.port))
-            
-            logger.info(f"UDP Server listening on port {self.port}")
-            
-            # Start receiving task
+
+            # Hand the socket to an asyncio datagram endpoint so packets
+            # are delivered by the event loop without per-packet thread hops
+            loop = asyncio.get_running_loop()
+            self.transport, self.protocol = await loop.create_datagram_endpoint(
+                lambda: _AeroflyDatagramProtocol(self),
+                sock=self.socket
+            )
+
+            logger.info("UDP Server listening on port %s", self.port)
+
             self.running = True
-            self.receive_task = asyncio.create_task(self._receive_loop())
             
             # Publish event
             await publish_event(
@@ -91,7 +159,7 @@ class UDPServer:
             return True
             
         except Exception as e:
-            logger.error(f"Error starting UDP Server: {e}")
+            logger.error("Error starting UDP Server: %s", e)
             
             # Clean up if error occurs
             if self.socket:
@@ -126,21 +194,17 @@ class UDPServer:
         try:
             # Stop the server
             self.running = False
-            
-            # Cancel receive task
-            if self.receive_task:
-                self.receive_task.cancel()
-                try:
-                    await self.receive_task
-                except asyncio.CancelledError:
-                    pass
-                self.receive_task = None
-            
-            # Close socket
-            if self.socket:
+
+            # Close the transport (this also closes the underlying socket)
+            if self.transport:
+                self.transport.close()
+                self.transport = None
+                self.protocol = None
+                self.socket = None
+            elif self.socket:
                 self.socket.close()
                 self.socket = None
-                
+
             logger.info("UDP Server stopped")
             
             # Publish event
@@ -156,7 +220,7 @@ class UDPServer:
             return True
             
         except Exception as e:
-            logger.error(f"Error stopping UDP Server: {e}")
+            logger.error("Error stopping UDP Server: %s", e)
             
             # Publish error event
             await publish_event(
@@ -170,69 +234,6 @@ class UDPServer:
             
             return False
 
-    async def _receive_loop(self) -> None:
-        """
-        Main receive loop for UDP data.
-        Runs in a separate task and processes incoming data.
-        """
-        logger.debug("UDP receive loop started")
-        
-        try:
-            while self.running:
-                try:
-                    # Receive data (will block until data arrives)
-                    # Use asyncio.to_thread to avoid blocking the event loop
-                    data, addr = await asyncio.to_thread(
-                        self.socket.recvfrom, 
-                        DEFAULT_BUFFER_SIZE
-                    )
-                    
-                    # Process the data
-                    await self._process_data(data, addr)
-                    
-                except (ConnectionError, OSError) as e:
-                    if self.running:
-                        logger.error(f"Socket error: {e}")
-                        
-                        # Attempt to reconnect after error
-                        await asyncio.sleep(1)
-                        continue
-                    else:
-                        # Server is shutting down
-                        break
-                        
-                except asyncio.CancelledError:
-                    # Task is being cancelled
-                    logger.debug("UDP receive task cancelled")
-                    break
-                    
-                except Exception as e:
-                    logger.error(f"Error in UDP receive loop: {e}")
-                    
-                    # Publish error event
-                    await publish_event(
-                        EventType.ERROR_OCCURRED,
-                        {
-                            'message': f"UDP receive error: {str(e)}",
-                            'component': 'UDPServer'
-                        },
-                        'UDPServer'
-                    )
-                    
-                    # Continue despite errors
-                    await asyncio.sleep(0.1)
-                    
-        finally:
-            logger.debug("UDP receive loop ended")
-            
-            # Make sure socket is closed
-            if self.socket and self.running:
-                try:
-                    self.socket.close()
-                    self.socket = None
-                except Exception as e:
-                    logger.error(f"Error closing socket: {e}")
-
     async def _process_data(self, data: bytes, addr: Tuple[str, int]) -> None:
         """
         Process received UDP data.
@@ -243,7 +244,13 @@ class UDPServer:
         """
         if not data:
             return
-            
+
+        # Dispatch on the raw ASCII prefix before paying for a decode;
+        # anything that isn't a ForeFlight XGPS/XATT line is ignored
+        if not (data.startswith(b'XGPS') or data.startswith(b'XATT')):
+            return
+
+        raw = None
         try:
             # Update last data time
             current_time = time.time()
@@ -253,40 +260,60 @@ class UDPServer:
             # If this is the first data received or it's been a while,
             # log connection information
             if first_data:
-                logger.info(f"First data received from {addr[0]}:{addr[1]}")
+                logger.info("First data received from %s:%s", addr[0], addr[1])
                 
-            # Decode the data
-            line = data.decode(DEFAULT_ENCODING, errors='ignore').strip()
-            
-            # Parse the data
-            timestamp = datetime.datetime.now(datetime.timezone.utc)
-            parsed_data = self.parser.parse_line(line, timestamp)
+            # Trim at the bytes level and keep the payload as bytes;
+            # parse_bytes works on the raw ASCII directly, so no packet
+            # pays for a full-buffer decode on the hot path
+            raw = data.strip(b'\r\n\t ')
+
+            # Parse the data, reusing the cached timestamp while the
+            # wall-clock second hasn't changed
+            current_second = int(current_time)
+            if current_second != self._ts_cache_second:
+                self._ts_cache_second = current_second
+                self._ts_cache = datetime.datetime.fromtimestamp(
+                    current_second, datetime.timezone.utc
+                )
+            parsed_data = self.parser.parse_bytes(raw, self._ts_cache)
             
             # Update latest data based on type
             from ..data.models import XGPSData, XATTData
-            if isinstance(parsed_data, XGPSData):
+            is_gps = isinstance(parsed_data, XGPSData)
+            if is_gps:
                 self.latest_gps_data = parsed_data
             elif isinstance(parsed_data, XATTData):
                 self.latest_att_data = parsed_data
-                
-            # Publish data received event
-            await publish_event(
-                EventType.DATA_RECEIVED,
-                {
-                    'data': parsed_data.to_dict(),
-                    'raw': line,
-                    'source': addr
-                },
-                'UDPServer'
-            )
+
+            # Publish data received event. Skip the payload construction
+            # entirely when nobody is listening, and sample non-GPS packets
+            # (attitude arrives at several Hz and only feeds status displays).
+            # GPS packets are always published since the flight recorder
+            # consumes them for IGC fixes.
+            self._pkt_counter += 1
+            if (is_gps or self._pkt_counter % DATA_EVENT_SAMPLE_RATE == 0) \
+                    and event_bus.has_subscribers(EventType.DATA_RECEIVED):
+                # Fire-and-forget: subscribers don't need the publish to
+                # complete before the next packet is processed
+                asyncio.create_task(publish_event(
+                    EventType.DATA_RECEIVED,
+                    {
+                        'data': parsed_data.to_dict(),
+                        # Decode only for packets that actually reach an
+                        # event payload
+                        'raw': raw.decode('ascii', errors='ignore'),
+                        'source': addr
+                    },
+                    'UDPServer'
+                ))
             
             # Log sample data periodically
             if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Received data: {line}")
-                logger.debug(f"Parsed as: {parsed_data}")
+                logger.debug("Received data: %s", raw)
+                logger.debug("Parsed as: %s", parsed_data)
                 
         except Exception as e:
-            logger.error(f"Error processing UDP data: {e}")
+            logger.error("Error processing UDP data: %s", e)
             
             # Publish error event
             await publish_event(
@@ -294,7 +321,10 @@ class UDPServer:
                 {
                     'message': f"Error processing UDP data: {str(e)}",
                     'component': 'UDPServer',
-                    'raw_data': data.decode(DEFAULT_ENCODING, errors='ignore') if isinstance(data, bytes) else str(data)
+                    # Decode only on the error path; fall back to a hex
+                    # dump if the failure happened before trimming
+                    'raw_data': (raw.decode('ascii', errors='ignore')
+                                 if raw is not None else data[:256].hex())
                 },
                 'UDPServer'
             )
@@ -314,56 +344,62 @@ class UDPServer:
         """
         if self.last_data_time is None:
             return False
-            
+
         # Check if data was received within the timeout period
-        timeout = settings.get('connection_timeout', 5.0)
-        return (time.time() - self.last_data_time) < timeout
+        return (time.time() - self.last_data_time) < self._connection_timeout
         
     def get_connection_status(self) -> dict:
         """
         Get the current connection status.
-        
+
         Returns:
-            dict: Dictionary with connection status information
+            dict: Dictionary with connection status information.
+                The dict is reused between calls and should be treated
+                as a read-only view.
         """
         current_time = time.time()
-        
-        status = {
-            'running': self.running,
-            'port': self.port,
-            'has_connection': self.has_connection
-        }
-        
+
+        status = self._status
+        status['running'] = self.running
+        status['has_connection'] = self.has_connection
+
         # Add time since last data if applicable
         if self.last_data_time is not None:
             status['last_data_seconds_ago'] = current_time - self.last_data_time
             status['last_data_time'] = datetime.datetime.fromtimestamp(
                 self.last_data_time
             ).strftime('%H:%M:%S')
-            
-        # Add latest data summary if available
-        if self.latest_gps_data:
+
+        # Add latest data summary if available; the nested dicts are only
+        # rebuilt when a new data object has actually arrived
+        gps_data = self.latest_gps_data
+        if gps_data:
             status['has_gps_data'] = True
-            status['latest_position'] = {
-                'latitude': self.latest_gps_data.latitude,
-                'longitude': self.latest_gps_data.longitude,
-                'altitude': self.latest_gps_data.alt_msl_meters,
-                'speed': self.latest_gps_data.ground_speed_mps,
-                'track': self.latest_gps_data.track_deg
-            }
+            if id(gps_data) != self._status_gps_id:
+                self._status_gps_id = id(gps_data)
+                status['latest_position'] = {
+                    'latitude': gps_data.latitude,
+                    'longitude': gps_data.longitude,
+                    'altitude': gps_data.alt_msl_meters,
+                    'speed': gps_data.ground_speed_mps,
+                    'track': gps_data.track_deg
+                }
         else:
             status['has_gps_data'] = False
-            
-        if self.latest_att_data:
+
+        att_data = self.latest_att_data
+        if att_data:
             status['has_attitude_data'] = True
-            status['latest_attitude'] = {
-                'heading': self.latest_att_data.heading_deg,
-                'pitch': self.latest_att_data.pitch_deg,
-                'roll': self.latest_att_data.roll_deg
-            }
+            if id(att_data) != self._status_att_id:
+                self._status_att_id = id(att_data)
+                status['latest_attitude'] = {
+                    'heading': att_data.heading_deg,
+                    'pitch': att_data.pitch_deg,
+                    'roll': att_data.roll_deg
+                }
         else:
             status['has_attitude_data'] = False
-            
+
         return status
 
 
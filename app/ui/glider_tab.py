@@ -27,19 +27,20 @@ class GliderTab:
         """
         self.parent = parent
         self.on_glider_selected = on_glider_selected
-        
-        # Tkinter variables
+
+        # Glider metadata cache, filled once in _load_gliders so every
+        # selection is a single dict lookup instead of a module call
+        self._glider_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Pending after() id used to debounce rapid selection changes
+        self._pending_after = None
+
+        # Tkinter variables. The info panel is a single multi-line label
+        # bound to one StringVar — one Tcl write per selection instead of
+        # seven separate variable/label pairs
         self.selected_glider = tk.StringVar()
-        self.glider_info = {
-            'manufacturer': tk.StringVar(),
-            'model': tk.StringVar(),
-            'wingspan': tk.StringVar(),
-            'competition_class': tk.StringVar(),
-            'igc_code': tk.StringVar(),
-            'glider_id': tk.StringVar(),
-            'description': tk.StringVar()
-        }
-        
+        self._info_var = tk.StringVar()
+
         # Create UI components
         self._create_ui()
         
@@ -67,61 +68,27 @@ class GliderTab:
         self.glider_combo.grid(row=0, column=1, sticky="ew", padx=5, pady=5)
         self.glider_combo.bind('<<ComboboxSelected>>', self._on_glider_selected)
         
-        # Information frame
+        # Information frame: one label bound to one variable holding the
+        # pre-formatted field text — far fewer Tcl widgets than a
+        # label-per-field grid, and a single write per selection
         info_frame = ttk.LabelFrame(self.parent, text="Glider Information", padding="10")
         info_frame.grid(row=1, column=0, sticky="ew", padx=5, pady=5)
-        info_frame.columnconfigure(1, weight=1)
-        
-        # Information fields
-        row = 0
-        
-        # Manufacturer
-        ttk.Label(info_frame, text="Manufacturer:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(info_frame, textvariable=self.glider_info['manufacturer']).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        row += 1
-        
-        # Model
-        ttk.Label(info_frame, text="Model:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(info_frame, textvariable=self.glider_info['model']).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        row += 1
-        
-        # Wingspan
-        ttk.Label(info_frame, text="Wingspan:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        wingspan_frame = ttk.Frame(info_frame)
-        wingspan_frame.grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        ttk.Label(wingspan_frame, textvariable=self.glider_info['wingspan']).pack(side="left")
-        ttk.Label(wingspan_frame, text=" meters").pack(side="left")
-        row += 1
-        
-        # Competition Class
-        ttk.Label(info_frame, text="Competition Class:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(info_frame, textvariable=self.glider_info['competition_class']).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        row += 1
-        
-        # IGC Code
-        ttk.Label(info_frame, text="IGC Code:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(info_frame, textvariable=self.glider_info['igc_code']).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        row += 1
-        
-        # Glider ID
-        ttk.Label(info_frame, text="Glider ID:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(info_frame, textvariable=self.glider_info['glider_id']).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        row += 1
-        
-        # Description
-        ttk.Label(info_frame, text="Description:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
+        info_frame.columnconfigure(0, weight=1)
+
         ttk.Label(
-            info_frame, 
-            textvariable=self.glider_info['description'],
-            wraplength=400
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
+            info_frame,
+            textvariable=self._info_var,
+            justify="left",
+            wraplength=500
+        ).grid(row=0, column=0, sticky="w", padx=5, pady=2)
 
     def _load_gliders(self) -> None:
         """Load the list of available gliders."""
         try:
-            # Get glider list
+            # Get glider list and pre-load all metadata into the cache
             gliders = get_glider_list()
-            
+            self._glider_cache = {name: get_glider_data(name) for name in gliders}
+
             # Update combobox values
             self.glider_combo['values'] = gliders
             
@@ -131,14 +98,28 @@ class GliderTab:
                 self._update_glider_info(gliders[0])
                 
         except Exception as e:
-            logger.error(f"Error loading glider list: {e}")
+            logger.error("Error loading glider list: %s", e)
 
     def _on_glider_selected(self, event) -> None:
-        """Handle glider selection change."""
-        selected = self.selected_glider.get()
+        """
+        Handle glider selection change.
+
+        Selections are debounced with a short after() delay so arrowing
+        through the dropdown fires the info update and the parent
+        callback once for the final choice, not once per keystroke.
+        """
+        if self._pending_after is not None:
+            self.parent.after_cancel(self._pending_after)
+        self._pending_after = self.parent.after(
+            50, self._do_select, self.selected_glider.get()
+        )
+
+    def _do_select(self, selected: str) -> None:
+        """Apply a (debounced) glider selection."""
+        self._pending_after = None
         if selected:
             self._update_glider_info(selected)
-            
+
             # Call callback if provided
             if self.on_glider_selected:
                 self.on_glider_selected(selected)
@@ -146,25 +127,29 @@ class GliderTab:
     def _update_glider_info(self, glider_name: str) -> None:
         """Update the displayed glider information."""
         try:
-            # Get glider data
-            glider = get_glider_data(glider_name)
+            # Get glider data from the cache
+            glider = self._glider_cache.get(glider_name)
             
             if glider:
-                # Update display variables
-                self.glider_info['manufacturer'].set(glider['manufacturer'])
-                self.glider_info['model'].set(glider['model'])
-                self.glider_info['wingspan'].set(str(glider['wingspan']))
-                self.glider_info['competition_class'].set(glider['competition_class'])
-                self.glider_info['igc_code'].set(glider['igc_code'])
-                self.glider_info['glider_id'].set(glider['glider_id'])
-                self.glider_info['description'].set(glider['description'])
+                # Build the whole panel text and write it with a single
+                # Tcl variable set (skipped when unchanged)
+                text = (
+                    f"Manufacturer: {glider['manufacturer']}\n"
+                    f"Model: {glider['model']}\n"
+                    f"Wingspan: {glider['wingspan']} meters\n"
+                    f"Competition Class: {glider['competition_class']}\n"
+                    f"IGC Code: {glider['igc_code']}\n"
+                    f"Glider ID: {glider['glider_id']}\n"
+                    f"Description: {glider['description']}"
+                )
             else:
-                # Clear all fields if glider not found
-                for var in self.glider_info.values():
-                    var.set("")
+                text = ""
+
+            if self._info_var.get() != text:
+                self._info_var.set(text)
                     
         except Exception as e:
-            logger.error(f"Error updating glider information: {e}")
+            logger.error("Error updating glider information: %s", e)
 
     def get_selected_glider_info(self) -> Dict[str, Any]:
         """
@@ -175,5 +160,5 @@ class GliderTab:
         """
         selected = self.selected_glider.get()
         if selected:
-            return get_glider_data(selected) or {}
-        return {} 
\ No newline at end of file
+            return self._glider_cache.get(selected) or get_glider_data(selected) or {}
+        return {}
\ No newline at end of file
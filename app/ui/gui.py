@@ -7,13 +7,14 @@ import logging
 import asyncio
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, font as tkfont
-import threading
 import sys
 import os
 from typing import Dict, Any, Optional, List, Tuple, Union, Callable
 import datetime
 import time
-import queue
+import re
+from collections import deque
+from functools import lru_cache
 
 from ..core.bridge import AeroflyBridge, create_bridge
 from ..utils.events import EventType, Event, event_bus, publish_event
@@ -22,17 +23,97 @@ from ..config.constants import (
     GUI_REFRESH_RATE_MS, GUI_FONT_FAMILY, GUI_FONT_SIZE, APP_NAME, APP_VERSION
 )
 from ..config.settings import settings
-from ..io.files import open_file_or_directory, get_igc_directory, list_igc_files
+from ..io.files import open_file_or_directory, get_igc_directory, list_igc_file_entries
 from .glider_tab import GliderTab
 
 # Configure logger
 logger = logging.getLogger("aerofly_igc_recorder.ui.gui")
 
+# Components whose errors are surfaced to the user; a frozenset gives
+# O(1) membership checks without rebuilding a list per error event
+_CRITICAL_ERROR_COMPONENTS = frozenset({'UDPServer', 'IGCWriter', 'AeroflyBridge'})
+
+# Number of file rows inserted into the files tab per batch; large IGC
+# directories are populated incrementally so mainloop stays responsive
+_FILE_LIST_BATCH_SIZE = 200
+
+# Error messages that warrant a modal dialog on top of the status
+# line; one precompiled alternation instead of chained substring scans
+_SERIOUS_ERROR_RE = re.compile(r'Failed to start|Connection')
+
+# Memoized basename: the status refresh re-derives the basename of
+# the same recording filename on every tick
+_basename = lru_cache(maxsize=64)(os.path.basename)
+
+# How long fix-count updates are conflated before the newest value is
+# written to the UI; per-fix label updates are imperceptible anyway
+_FIX_COUNT_FLUSH_SECONDS = 0.5
+
+# Interval of the slow status watchdog. Event handlers refresh the UI
+# when telemetry actually arrives; the watchdog only has to notice
+# changes no event announces (connection timeout, duration tick)
+_STATUS_WATCHDOG_SECONDS = 1.0
+
+# Row tables for the main-tab label grids. Each telemetry row is
+# (label text, tk variable name, unit, value width); building the
+# grids from these in a loop replaces a near-identical widget block
+# per field.
+_INFO_ROWS = [
+    ("Status:", 'recording_status', 'bold'),
+    ("Duration:", 'duration', 'courier10'),
+    ("Fixes (Tracking Points):", 'fix_count', None),
+]
+
+_POSITION_ROWS = [
+    ("Latitude:", 'latitude', "°", 12),
+    ("Longitude:", 'longitude', "°", 12),
+    ("Altitude:", 'altitude', "ft", 8),
+    ("Speed:", 'speed', "kts", 8),
+    ("Track:", 'track', "°", 8),
+]
+
+_ATTITUDE_ROWS = [
+    ("Heading:", 'heading', "°", 8),
+    ("Pitch:", 'pitch', "°", 8),
+    ("Roll:", 'roll', "°", 8),
+]
+
+_RECORDING_FIELDS = [
+    ("Pilot Name:", 'pilot_name'),
+    ("Aircraft Type:", 'glider_type'),
+    ("Registration:", 'glider_id'),
+]
+
+# Initial text of the display-only labels. These fields have no
+# StringVar: updates go straight to the widget via _set_var, skipping
+# the Tcl variable write and trace dispatch per update
+_DISPLAY_DEFAULTS = {
+    'connection_status': "Disconnected",
+    'recording_status': "Not Recording",
+    'fix_count': "0",
+    'duration': "00:00:00",
+    'latitude': "0.000000",
+    'longitude': "0.000000",
+    'altitude': "0",
+    'speed': "0",
+    'track': "0",
+    'heading': "0",
+    'pitch': "0",
+    'roll': "0",
+    'status_message': "Initializing...",
+}
+
 
 class AsyncTkinterLoop:
     """
     Helper class to integrate asyncio with Tkinter.
     Allows running asyncio tasks in a Tkinter application.
+
+    The asyncio loop runs on the Tk main thread: a root.after timer
+    periodically lets the loop process whatever is ready and then hands
+    control back to Tk. Compared to the previous background-thread
+    design this removes the thread switch per UI-visible event and the
+    GIL contention between the Tk and asyncio threads.
     """
 
     def __init__(self, root):
@@ -46,47 +127,114 @@ class AsyncTkinterLoop:
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
 
-        # Queue for callbacks from asyncio to Tkinter
-        self.callback_queue = queue.Queue()
+        # Interval between asyncio loop ticks driven from the Tk timer
+        self._tick_ms = 5
+        self._tick_running = False
+
+        # Queue for UI callbacks emitted from coroutines. A deque is
+        # enough here: append and popleft are atomic at the C level, and
+        # the drain applies per-key coalescing before touching widgets
+        self.callback_queue = deque()
+
+        # Adaptive poll interval: drain quickly while callbacks are
+        # flowing, back off exponentially up to the ceiling when idle
+        self._min_delay_ms = 5
+        self._max_delay_ms = 50
+        self._idle_count = 0
 
         # Start checking the queue
         self.schedule_check_queue()
 
-    def schedule_check_queue(self) -> None:
+    def schedule_check_queue(self, delay_ms: Optional[int] = None) -> None:
         """Schedule the next queue check."""
-        self.root.after(50, self.check_queue)
+        if delay_ms is None:
+            delay_ms = self._max_delay_ms
+        self.root.after(delay_ms, self.check_queue)
 
     def check_queue(self) -> None:
-        """Process callbacks from asyncio thread to Tkinter thread."""
-        try:
-            # Process all callbacks in the queue
-            while not self.callback_queue.empty():
-                callback, args, kwargs = self.callback_queue.get_nowait()
-                callback(*args, **kwargs)
-        except Exception as e:
-            logger.error(f"Error in callback queue: {e}")
-        finally:
-            # Schedule the next check
-            self.schedule_check_queue()
+        """Process queued UI callbacks, coalescing keyed duplicates."""
+        processed = 0
+
+        # Drain the whole queue first so keyed callbacks can be
+        # coalesced: when several updates share a coalesce_key only
+        # the newest runs, saving redundant widget reconfigures when
+        # telemetry outpaces the Tk frame rate
+        items = []
+        popleft = self.callback_queue.popleft
+        while True:
+            try:
+                items.append(popleft())
+            except IndexError:
+                break
+
+        latest = {}
+        for index, item in enumerate(items):
+            if item[0] is not None:
+                latest[item[0]] = index
+
+        # Guard each callback individually so one failure is logged and
+        # skipped instead of aborting the rest of the drain
+        for index, (key, callback, args, kwargs) in enumerate(items):
+            if key is None or latest[key] == index:
+                try:
+                    callback(*args, **kwargs)
+                except Exception as e:
+                    logger.error("UI callback failed: %s", e)
+                processed += 1
+
+        # Re-poll quickly while traffic is flowing so UI updates
+        # aren't delayed a full idle interval; back off when quiet
+        if processed:
+            self._idle_count = 0
+            next_delay = self._min_delay_ms
+        else:
+            self._idle_count += 1
+            next_delay = min(
+                self._max_delay_ms,
+                self._min_delay_ms * (1 << min(self._idle_count, 3))
+            )
+        self.schedule_check_queue(next_delay)
 
     def start(self) -> None:
-        """Start the asyncio event loop in a background thread."""
-        self.thread = threading.Thread(target=self._run_loop, daemon=True)
-        self.thread.start()
+        """Start ticking the asyncio event loop from the Tk timer."""
+        self._tick_running = True
+        self.root.after(self._tick_ms, self._tick)
 
-    def _run_loop(self) -> None:
-        """Run the asyncio event loop."""
-        asyncio.set_event_loop(self.loop)
-        self.loop.run_forever()
+    def _tick(self) -> None:
+        """Run one batch of ready asyncio callbacks, then yield to Tk."""
+        if not self._tick_running:
+            return
+
+        # A modal dialog opened from a coroutine re-enters the Tk event
+        # loop while the asyncio loop is mid-callback; skip this tick
+        # rather than re-entering run_forever
+        if not self.loop.is_running():
+            self.loop.call_soon(self.loop.stop)
+            self.loop.run_forever()
+
+        self.root.after(self._tick_ms, self._tick)
 
     def stop(self) -> None:
-        """Stop the asyncio event loop."""
-        if hasattr(self, 'loop') and self.loop.is_running():
-            self.loop.call_soon_threadsafe(self.loop.stop)
+        """Stop ticking the asyncio event loop."""
+        self._tick_running = False
+
+    def run_until_complete(self, coro):
+        """
+        Run a coroutine to completion on the asyncio loop.
+        Only valid once ticking has stopped (e.g. during shutdown).
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        return self.loop.run_until_complete(coro)
 
     def create_task(self, coro) -> asyncio.Task:
         """
         Create an asyncio task in the event loop.
+        The task starts running on the next loop tick.
 
         Args:
             coro: Coroutine to run
@@ -94,21 +242,22 @@ class AsyncTkinterLoop:
         Returns:
             asyncio.Task: The created task
         """
-        if hasattr(self, 'loop'):
-            return asyncio.run_coroutine_threadsafe(coro, self.loop)
-        else:
-            raise RuntimeError("AsyncTkinterLoop not initialized")
+        return self.loop.create_task(coro)
 
-    def call_soon_in_main_thread(self, callback, *args, **kwargs) -> None:
+    def call_soon_in_main_thread(self, callback, *args,
+                                 coalesce_key=None, **kwargs) -> None:
         """
         Schedule a callback to run in the main (Tkinter) thread.
 
         Args:
             callback: Function to call
             *args: Positional arguments for the callback
+            coalesce_key: Optional hashable key; if several callbacks
+                with the same key are queued before the next drain, only
+                the most recent one runs
             **kwargs: Keyword arguments for the callback
         """
-        self.callback_queue.put((callback, args, kwargs))
+        self.callback_queue.append((coalesce_key, callback, args, kwargs))
 
 
 class GUI:
@@ -127,18 +276,63 @@ class GUI:
         # Tkinter variables for UI state
         self.tk_vars = {}
 
+        # Last value written to each tk_var by the status loop; used to
+        # skip redundant Tcl writes when telemetry hasn't changed
+        self._last_var_values = {}
+
         # UI components
         self.components = {}
 
+        # Display-only value labels keyed by field name; _set_var
+        # writes their text directly instead of through a StringVar
+        self._display_labels: Dict[str, ttk.Label] = {}
+
         # Event subscription tasks
         self.event_tasks = []
 
+        # Resolved IGC output directory, cached so file-list refreshes
+        # and folder opens don't re-run the settings lookup and makedirs
+        # probe each time; invalidated when the user picks a new directory
+        self._igc_dir = None
+
+        # Generation counter for incremental file-list population;
+        # bumping it cancels batches left over from a previous refresh
+        self._file_list_gen = 0
+
+        # Pending after() id used to debounce file-list refreshes
+        self._refresh_after_id = None
+
+        # Set once _cleanup has run, so the fallback join in run()
+        # doesn't repeat it after _on_close already did
+        self._cleaned_up = False
+
+        # Entries currently shown in the files tab, used to skip the
+        # clear-and-reinsert cycle when a refresh finds no changes
+        self._applied_file_entries: Optional[List[Dict[str, Any]]] = None
+
+        # Monotonic time of the last event-driven status push, used to
+        # rate-limit refreshes to GUI_REFRESH_RATE_MS
+        self._last_ui_push = 0.0
+
+        # Raw position/attitude tuples from the previous refresh, so an
+        # unchanged fix skips conversion and formatting altogether
+        self._last_pos: Optional[Tuple] = None
+        self._last_att: Optional[Tuple] = None
+
+        # Conflated fix-count display state: position events only
+        # record the newest count here, and an armed timer flushes it
+        self._pending_fix_count: Optional[int] = None
+        self._fix_count_timer_armed = False
+
         logger.info("GUI initialized")
 
-    async def run(self) -> None:
+    def run(self) -> None:
         """
         Run the GUI.
-        This is the main entry point for the GUI.
+        This is the main entry point for the GUI. It owns the main
+        thread: the asyncio loop created by AsyncTkinterLoop is the
+        only loop in the process and is ticked from the Tk timer, so
+        this must not be called from a running event loop.
         """
         # Create the Tkinter root window
         self.root = tk.Tk()
@@ -168,51 +362,48 @@ class GUI:
         self.running = True
         self.root.mainloop()
 
-        # Clean up after main loop ends
-        self.async_loop.create_task(self._cleanup())
-
-        # Wait for cleanup to complete
-        time.sleep(0.5)
-
-        # Stop asyncio loop
+        # The normal close path (_on_close) has already stopped the
+        # tick pump and joined _cleanup before destroying the window;
+        # this only runs when mainloop exits some other way. _cleanup
+        # touches no widgets, so it is safe after the root is gone.
         self.async_loop.stop()
+        if not self._cleaned_up:
+            self.async_loop.run_until_complete(self._cleanup())
 
         logger.info("GUI exited")
 
     def _setup_tk_variables(self) -> None:
-        """Set up Tkinter variables for UI state."""
-        # Connection status
-        self.tk_vars['connection_status'] = tk.StringVar(self.root, "Disconnected")
-        self.tk_vars['connection_color'] = tk.StringVar(self.root, "red")
-
-        # Recording status
-        self.tk_vars['recording_status'] = tk.StringVar(self.root, "Not Recording")
-        self.tk_vars['recording_color'] = tk.StringVar(self.root, "gray")
-        self.tk_vars['fix_count'] = tk.StringVar(self.root, "0")
-        self.tk_vars['duration'] = tk.StringVar(self.root, "00:00:00")
-
-        # Position data
-        self.tk_vars['latitude'] = tk.StringVar(self.root, "0.000000")
-        self.tk_vars['longitude'] = tk.StringVar(self.root, "0.000000")
-        self.tk_vars['altitude'] = tk.StringVar(self.root, "0")
-        self.tk_vars['speed'] = tk.StringVar(self.root, "0")
-        self.tk_vars['track'] = tk.StringVar(self.root, "0")
-
-        # Attitude data
-        self.tk_vars['heading'] = tk.StringVar(self.root, "0")
-        self.tk_vars['pitch'] = tk.StringVar(self.root, "0")
-        self.tk_vars['roll'] = tk.StringVar(self.root, "0")
+        """
+        Set up Tkinter variables for UI state.
 
+        Only editable fields get a StringVar; display-only values
+        (telemetry, status text) are written straight to their labels,
+        which skips the Tcl variable and trace machinery per update.
+        """
         # Flight details
         self.tk_vars['pilot_name'] = tk.StringVar(self.root, settings.get('default_pilot_name', "Simulator Pilot"))
         self.tk_vars['glider_type'] = tk.StringVar(self.root, settings.get('default_glider_type', "Aerofly FS4"))
         self.tk_vars['glider_id'] = tk.StringVar(self.root, settings.get('default_glider_id', "SIM"))
 
-        # Status message
-        self.tk_vars['status_message'] = tk.StringVar(self.root, "Initializing...")
+        # Bound .set methods, hoisted once: the hot update path pays a
+        # single dict lookup instead of a dict lookup plus bound-method
+        # creation per write
+        self._setters = {name: var.set for name, var in self.tk_vars.items()}
 
     def _setup_ui(self) -> None:
         """Set up the user interface components."""
+        # Shared font objects: every inline tkfont.Font() call creates a
+        # new Tcl font resource, so the handful of styles used across
+        # the tabs are built once and reused
+        self._fonts = {
+            'status': tkfont.Font(size=10),
+            'bold': tkfont.Font(weight='bold'),
+            'bold10': tkfont.Font(size=10, weight='bold'),
+            'courier10': tkfont.Font(family='Courier', size=10),
+            'h1': tkfont.Font(size=16, weight='bold'),
+            'h2': tkfont.Font(size=12, weight='bold')
+        }
+
         # Configure grid
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(1, weight=1)
@@ -232,11 +423,14 @@ class GUI:
         self.components['notebook'] = notebook
 
         # Create tabs
-        self._create_main_tab(notebook)
-        self._create_glider_tab(notebook)
-        self._create_settings_tab(notebook)
-        self._create_files_tab(notebook)
-        self._create_about_tab(notebook)
+        for builder in (
+            self._create_main_tab,
+            self._create_glider_tab,
+            self._create_settings_tab,
+            self._create_files_tab,
+            self._create_about_tab,
+        ):
+            builder(notebook)
 
         # Create control bar at the bottom
         self._create_control_bar()
@@ -248,10 +442,9 @@ class GUI:
         status_frame.columnconfigure(1, weight=1)
 
         # Status label
-        status_label = ttk.Label(
-            status_frame,
-            textvariable=self.tk_vars['status_message'],
-            font=tkfont.Font(size=10)
+        status_label = self._make_value_label(
+            status_frame, 'status_message',
+            font=self._fonts['status']
         )
         status_label.grid(row=0, column=0, sticky="w", padx=5)
 
@@ -268,26 +461,23 @@ class GUI:
             text="Connection:"
         ).pack(side="left", padx=(0, 5))
 
-        connection_status = ttk.Label(
-            connection_frame,
-            textvariable=self.tk_vars['connection_status'],
+        connection_status = self._make_value_label(
+            connection_frame, 'connection_status',
             foreground="red",
-            font=tkfont.Font(size=10, weight="bold")
+            font=self._fonts['bold10']
         )
         connection_status.pack(side="right")
         self.components['connection_status'] = connection_status
 
-        # Update the foreground color when it changes
-        def update_connection_color(*args):
-            color = self.tk_vars['connection_color'].get()
-            connection_status.configure(foreground=color)
-
-        self.tk_vars['connection_color'].trace_add('write', update_connection_color)
+    def _add_tab(self, notebook, title: str, padding: str = "10") -> ttk.Frame:
+        """Create a padded frame and add it to the notebook as a tab."""
+        frame = ttk.Frame(notebook, padding=padding)
+        notebook.add(frame, text=title)
+        return frame
 
     def _create_main_tab(self, notebook) -> None:
         """Create the main tab with flight information."""
-        main_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(main_frame, text="Flight")
+        main_frame = self._add_tab(notebook, "Flight")
 
         main_frame.columnconfigure(1, weight=1)
 
@@ -309,171 +499,57 @@ class GUI:
         recording_frame.grid(row=2, column=0, columnspan=2, sticky="ew")
         recording_frame.columnconfigure(1, weight=1)
 
-        # Fill flight info frame
-        row = 0
-
-        # Recording status
-        ttk.Label(info_frame, text="Status:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        recording_status = ttk.Label(
-            info_frame,
-            textvariable=self.tk_vars['recording_status'],
-            foreground="gray",
-            font=tkfont.Font(weight="bold")
-        )
-        recording_status.grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        self.components['recording_status'] = recording_status
-
-        # Update the foreground color when it changes
-        def update_recording_color(*args):
-            color = self.tk_vars['recording_color'].get()
-            recording_status.configure(foreground=color)
-
-        self.tk_vars['recording_color'].trace_add('write', update_recording_color)
-
-        row += 1
-
-        # Duration
-        ttk.Label(info_frame, text="Duration:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(
-            info_frame,
-            textvariable=self.tk_vars['duration'],
-            font=tkfont.Font(family="Courier", size=10)
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-
-        row += 1
-
-        # Fix count
-        ttk.Label(info_frame, text="Fixes (Tracking Points):").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(
-            info_frame,
-            textvariable=self.tk_vars['fix_count']
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-
-        # Fill position frame
-        row = 0
-
-        # Latitude
-        ttk.Label(position_frame, text="Latitude:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(
-            position_frame,
-            textvariable=self.tk_vars['latitude'],
-            width=12
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        ttk.Label(position_frame, text="°").grid(row=row, column=2, sticky="w", pady=2)
-
-        row += 1
-
-        # Longitude
-        ttk.Label(position_frame, text="Longitude:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(
-            position_frame,
-            textvariable=self.tk_vars['longitude'],
-            width=12
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        ttk.Label(position_frame, text="°").grid(row=row, column=2, sticky="w", pady=2)
-
-        row += 1
-
-        # Altitude
-        ttk.Label(position_frame, text="Altitude:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(
-            position_frame,
-            textvariable=self.tk_vars['altitude'],
-            width=8
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        ttk.Label(position_frame, text="ft").grid(row=row, column=2, sticky="w", pady=2)
-
-        row += 1
-
-        # Speed
-        ttk.Label(position_frame, text="Speed:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(
-            position_frame,
-            textvariable=self.tk_vars['speed'],
-            width=8
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        ttk.Label(position_frame, text="kts").grid(row=row, column=2, sticky="w", pady=2)
-
-        row += 1
-
-        # Track
-        ttk.Label(position_frame, text="Track:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(
-            position_frame,
-            textvariable=self.tk_vars['track'],
-            width=8
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        ttk.Label(position_frame, text="°").grid(row=row, column=2, sticky="w", pady=2)
-
-        # Fill attitude frame
-        row = 0
-
-        # Heading
-        ttk.Label(attitude_frame, text="Heading:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(
-            attitude_frame,
-            textvariable=self.tk_vars['heading'],
-            width=8
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        ttk.Label(attitude_frame, text="°").grid(row=row, column=2, sticky="w", pady=2)
-
-        row += 1
-
-        # Pitch
-        ttk.Label(attitude_frame, text="Pitch:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(
-            attitude_frame,
-            textvariable=self.tk_vars['pitch'],
-            width=8
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        ttk.Label(attitude_frame, text="°").grid(row=row, column=2, sticky="w", pady=2)
-
-        row += 1
+        # Fill flight info frame: (label, field, font key or None)
+        for row, (label, field, font) in enumerate(_INFO_ROWS):
+            ttk.Label(info_frame, text=label).grid(row=row, column=0, sticky="w", padx=5, pady=2)
+            kwargs = {}
+            if font:
+                kwargs['font'] = self._fonts[font]
+            if field == 'recording_status':
+                kwargs['foreground'] = "gray"
+            value_label = self._make_value_label(info_frame, field, **kwargs)
+            value_label.grid(row=row, column=1, sticky="w", padx=5, pady=2)
+            if field == 'recording_status':
+                self.components['recording_status'] = value_label
+
+        # Fill position and attitude frames from the row tables
+        self._fill_telemetry_rows(position_frame, _POSITION_ROWS)
+        self._fill_telemetry_rows(attitude_frame, _ATTITUDE_ROWS)
+
+        # Fill recording frame: (label, variable)
+        for row, (label, var) in enumerate(_RECORDING_FIELDS):
+            ttk.Label(recording_frame, text=label).grid(row=row, column=0, sticky="w", padx=5, pady=2)
+            ttk.Entry(
+                recording_frame,
+                textvariable=self.tk_vars[var],
+                width=30
+            ).grid(row=row, column=1, sticky="ew", padx=5, pady=2)
+
+    def _make_value_label(self, parent, field: str, **kwargs) -> ttk.Label:
+        """
+        Create a display-only value label and register it so _set_var
+        can update its text directly.
+        """
+        label = ttk.Label(parent, text=_DISPLAY_DEFAULTS[field], **kwargs)
+        self._display_labels[field] = label
+        return label
 
-        # Roll
-        ttk.Label(attitude_frame, text="Roll:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(
-            attitude_frame,
-            textvariable=self.tk_vars['roll'],
-            width=8
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        ttk.Label(attitude_frame, text="°").grid(row=row, column=2, sticky="w", pady=2)
-
-        # Fill recording frame
-        row = 0
-
-        # Pilot name
-        ttk.Label(recording_frame, text="Pilot Name:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Entry(
-            recording_frame,
-            textvariable=self.tk_vars['pilot_name'],
-            width=30
-        ).grid(row=row, column=1, sticky="ew", padx=5, pady=2)
-
-        row += 1
-
-        # Glider type
-        ttk.Label(recording_frame, text="Aircraft Type:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Entry(
-            recording_frame,
-            textvariable=self.tk_vars['glider_type'],
-            width=30
-        ).grid(row=row, column=1, sticky="ew", padx=5, pady=2)
-
-        row += 1
-
-        # Registration
-        ttk.Label(recording_frame, text="Registration:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
-        ttk.Entry(
-            recording_frame,
-            textvariable=self.tk_vars['glider_id'],
-            width=30
-        ).grid(row=row, column=1, sticky="ew", padx=5, pady=2)
+    def _fill_telemetry_rows(self, frame, rows) -> None:
+        """
+        Populate a telemetry frame from a (label, field, unit, width)
+        row table. One loop instead of a near-identical widget block per
+        field keeps the tab builder compact.
+        """
+        for row, (label, field, unit, width) in enumerate(rows):
+            ttk.Label(frame, text=label).grid(row=row, column=0, sticky="w", padx=5, pady=2)
+            self._make_value_label(
+                frame, field, width=width
+            ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
+            ttk.Label(frame, text=unit).grid(row=row, column=2, sticky="w", pady=2)
 
     def _create_glider_tab(self, notebook) -> None:
         """Create the glider selection tab."""
-        glider_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(glider_frame, text="Glider")
+        glider_frame = self._add_tab(notebook, "Glider")
 
         # Create glider tab component
         self.components['glider_tab'] = GliderTab(
@@ -494,8 +570,7 @@ class GUI:
 
     def _create_settings_tab(self, notebook) -> None:
         """Create the settings tab."""
-        settings_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(settings_frame, text="Settings")
+        settings_frame = self._add_tab(notebook, "Settings")
 
         settings_frame.columnconfigure(1, weight=1)
 
@@ -583,8 +658,7 @@ class GUI:
 
     def _create_files_tab(self, notebook) -> None:
         """Create the files tab with IGC file listing."""
-        files_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(files_frame, text="Files")
+        files_frame = self._add_tab(notebook, "Files")
 
         files_frame.columnconfigure(0, weight=1)
         files_frame.rowconfigure(1, weight=1)
@@ -597,7 +671,7 @@ class GUI:
         ttk.Label(
             header_frame,
             text="IGC Files:",
-            font=tkfont.Font(size=12, weight="bold")
+            font=self._fonts['h2']
         ).grid(row=0, column=0, sticky="w")
 
         # Refresh button
@@ -656,8 +730,7 @@ class GUI:
 
     def _create_about_tab(self, notebook) -> None:
         """Create the about tab with application information."""
-        about_frame = ttk.Frame(notebook, padding="20")
-        notebook.add(about_frame, text="About")
+        about_frame = self._add_tab(notebook, "About", padding="20")
 
         about_frame.columnconfigure(0, weight=1)
 
@@ -665,7 +738,7 @@ class GUI:
         ttk.Label(
             about_frame,
             text=APP_NAME,
-            font=tkfont.Font(size=16, weight="bold")
+            font=self._fonts['h1']
         ).grid(row=0, column=0, pady=(0, 5))
 
         # Version
@@ -722,7 +795,7 @@ class GUI:
         ttk.Label(
             about_frame,
             text="Instructions",
-            font=tkfont.Font(size=12, weight="bold")
+            font=self._fonts['h2']
         ).grid(row=7, column=0, pady=(0, 10))
 
         instructions = (
@@ -785,7 +858,7 @@ class GUI:
     def _handle_start_recording(self) -> None:
         """Handle the start recording button click."""
         # Disable the button immediately to prevent double clicks
-        self.start_button.configure(state="disabled")
+        self._set_button_state('start_button', "disabled")
         
         # Create and handle the async task
         task = self.async_loop.create_task(self._start_recording())
@@ -798,7 +871,7 @@ class GUI:
                 # Log the error
                 logger.error(f"Error in start recording task: {e}")
                 # Re-enable the button if there was an error
-                self.start_button.configure(state="normal")
+                self._set_button_state('start_button', "normal")
                 # Show error to user
                 messagebox.showerror("Error", f"Failed to start recording: {str(e)}")
         
@@ -811,11 +884,11 @@ class GUI:
         """Start the application and initialize all components."""
         try:
             # Update status
-            self.tk_vars['status_message'].set("Starting bridge...")
+            self._set_var('status_message', "Starting bridge...")
 
             # Start the bridge
             if not await self.bridge.start():
-                self.tk_vars['status_message'].set("Failed to start bridge")
+                self._set_var('status_message', "Failed to start bridge")
                 messagebox.showerror(
                     "Error",
                     "Failed to start the bridge. Please check the logs for details."
@@ -823,7 +896,7 @@ class GUI:
                 return
 
             # Update status
-            self.tk_vars['status_message'].set("Bridge started")
+            self._set_var('status_message', "Bridge started")
 
             # Subscribe to events
             await self._subscribe_to_events()
@@ -845,22 +918,24 @@ class GUI:
             logger.info("Application started successfully")
         except Exception as e:
             logger.error(f"Error starting application: {e}")
-            self.tk_vars['status_message'].set(f"Error: {str(e)}")
+            self._set_var('status_message', f"Error: {str(e)}")
             messagebox.showerror(
                 "Error",
                 f"Error starting application: {str(e)}"
             )
 
     async def _cleanup(self) -> None:
-        """Clean up resources before exiting."""
-        try:
-            # Set status
-            if hasattr(self, 'tk_vars') and 'status_message' in self.tk_vars:
-                self.tk_vars['status_message'].set("Shutting down...")
+        """
+        Clean up resources before exiting.
 
+        Deliberately touches no widgets: the normal close path runs it
+        while the root still exists, but the fallback join in run()
+        reaches it after the window has been destroyed, where any Tk
+        call would raise TclError and abort the bridge shutdown.
+        """
+        try:
             # Stop recording if active
-            if (hasattr(self, 'bridge') and self.bridge and
-                    self.bridge.get_recording_status().get('recording', {}).get('recording', False)):
+            if self._is_recording():
                 await self.bridge.stop_recording()
 
             # Cancel all tasks
@@ -877,21 +952,21 @@ class GUI:
             self.event_tasks.clear()
 
             # Stop the bridge
-            if hasattr(self, 'bridge') and self.bridge:
+            if self.bridge is not None:
                 await self.bridge.stop()
 
             logger.info("Application cleanup completed")
         except Exception as e:
+            # Log and fall through: the caller destroys the window (or
+            # already has), so no Tk call belongs here
             logger.error(f"Error during cleanup: {e}")
-            # Ensure we still destroy the window even if cleanup fails
-            if hasattr(self, 'root'):
-                self.root.after(0, self.root.destroy)
+        finally:
+            self._cleaned_up = True
 
     def _on_close(self) -> None:
         """Handle the window close event."""
         # Check if recording is in progress
-        if (hasattr(self, 'bridge') and self.bridge and
-                self.bridge.get_recording_status().get('recording', {}).get('recording', False)):
+        if self._is_recording():
             # Ask for confirmation
             if not messagebox.askyesno(
                     "Recording in Progress",
@@ -902,9 +977,13 @@ class GUI:
         # Set running flag to false
         self.running = False
 
-        # Stop the async loop first
-        if hasattr(self, 'async_loop'):
+        # Stop ticking, then join cleanup while the root still exists:
+        # destroying the window first would make any status write or
+        # dialog raise TclError, and the bridge (and a confirmed
+        # stop-recording) must shut down regardless
+        if self.async_loop is not None:
             self.async_loop.stop()
+            self.async_loop.run_until_complete(self._cleanup())
 
         # Then destroy the window
         self.root.destroy()
@@ -912,44 +991,17 @@ class GUI:
     async def _subscribe_to_events(self) -> None:
         """Subscribe to events from the event bus."""
         try:
-            # Subscribe to connection events
-            await event_bus.subscribe(
-                EventType.CONNECTION_ESTABLISHED,
-                self._handle_connection_established
-            )
-
-            await event_bus.subscribe(
-                EventType.CONNECTION_LOST,
-                self._handle_connection_lost
-            )
-
-            # Subscribe to recording events
-            await event_bus.subscribe(
-                EventType.RECORDING_STARTED,
-                self._handle_recording_started
-            )
-
-            await event_bus.subscribe(
-                EventType.RECORDING_STOPPED,
-                self._handle_recording_stopped
-            )
-
-            await event_bus.subscribe(
-                EventType.POSITION_ADDED,
-                self._handle_position_added
-            )
-
-            # Subscribe to data events
-            await event_bus.subscribe(
-                EventType.DATA_RECEIVED,
-                self._handle_data_received
-            )
-
-            # Subscribe to error events
-            await event_bus.subscribe(
-                EventType.ERROR_OCCURRED,
-                self._handle_error
-            )
+            # One batched call installs every handler under a single
+            # bus-lock acquisition
+            await event_bus.subscribe_many({
+                EventType.CONNECTION_ESTABLISHED: self._handle_connection_established,
+                EventType.CONNECTION_LOST: self._handle_connection_lost,
+                EventType.RECORDING_STARTED: self._handle_recording_started,
+                EventType.RECORDING_STOPPED: self._handle_recording_stopped,
+                EventType.POSITION_ADDED: self._handle_position_added,
+                EventType.DATA_RECEIVED: self._handle_data_received,
+                EventType.ERROR_OCCURRED: self._handle_error,
+            })
 
             logger.debug("Subscribed to events")
         except Exception as e:
@@ -958,8 +1010,13 @@ class GUI:
 
     async def _status_update_loop(self) -> None:
         """
-        Background task that periodically updates the UI status.
-        Updates connection status, position data, and recording status.
+        Slow watchdog that keeps the UI status fresh.
+
+        Telemetry-driven refreshes come from the event handlers (rate
+        limited to GUI_REFRESH_RATE_MS); this loop only covers state
+        changes no event announces — the connection timing out, the
+        recording duration ticking over — so it can wake once per
+        second instead of ten times.
         """
         try:
             while self.running:
@@ -971,8 +1028,7 @@ class GUI:
                     if self.bridge.running:
                         self._update_recording_status()
 
-                    # Sleep for a short time
-                    await asyncio.sleep(GUI_REFRESH_RATE_MS / 1000)
+                    await asyncio.sleep(_STATUS_WATCHDOG_SECONDS)
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
@@ -981,6 +1037,58 @@ class GUI:
         except asyncio.CancelledError:
             logger.debug("Status update loop cancelled")
 
+    def _set_var(self, name: str, value: str) -> None:
+        """
+        Set a UI value only if it actually changed.
+
+        Display-only fields have no StringVar: their label text is
+        configured directly, one Tcl call with no variable write or
+        trace dispatch. Editable fields go through their hoisted
+        StringVar setter. Either way a write is a Tcl round-trip, so
+        the periodic status updates go through this cache to keep
+        static telemetry free.
+        """
+        if self._last_var_values.get(name) != value:
+            self._last_var_values[name] = value
+            label = self._display_labels.get(name)
+            if label is not None:
+                label.configure(text=value)
+                return
+            setter = self._setters.get(name)
+            if setter is None:
+                # Variables registered after _setup_tk_variables (the
+                # settings-tab vars) get their setter bound on first use
+                setter = self._setters[name] = self.tk_vars[name].set
+            setter(value)
+
+    def _set_fg(self, component: str, color: str) -> None:
+        """
+        Set a label's foreground color directly, skipping when unchanged.
+
+        Configuring the widget here replaces the old color StringVar and
+        its write trace — one Tcl call per transition instead of a
+        variable write, a trace fire and a .get() round-trip.
+        """
+        cache_key = ('fg', component)
+        if self._last_var_values.get(cache_key) != color:
+            self._last_var_values[cache_key] = color
+            self.components[component].configure(foreground=color)
+
+    def _set_button_state(self, component: str, state: str) -> None:
+        """
+        Set a button's state, skipping the Tcl config call when the
+        button is already in that state. Runs on every recording-status
+        refresh, so the cache keeps steady-state ticks free.
+        """
+        cache_key = ('state', component)
+        if self._last_var_values.get(cache_key) != state:
+            self._last_var_values[cache_key] = state
+            self.components[component].config(state=state)
+
+    def _is_recording(self) -> bool:
+        """Check whether a recording is currently in progress."""
+        return bool(self.bridge) and self.bridge.is_recording()
+
     def _update_connection_status(self) -> None:
         """Update the connection status display."""
         if not self.bridge:
@@ -993,80 +1101,90 @@ class GUI:
         has_connection = status.get('has_connection', False)
 
         if has_connection:
-            self.tk_vars['connection_status'].set("Connected")
-            self.tk_vars['connection_color'].set("green")
+            self._set_var('connection_status', "Connected")
+            self._set_fg('connection_status', "green")
         else:
-            self.tk_vars['connection_status'].set("Disconnected")
-            self.tk_vars['connection_color'].set("red")
+            self._set_var('connection_status', "Disconnected")
+            self._set_fg('connection_status', "red")
 
-        # Update position and attitude data if available
+        # Update position and attitude data if available. Raw values
+        # are compared first so an unchanged fix (aircraft parked,
+        # duplicate datagram) skips the unit conversions and f-string
+        # formatting entirely, not just the Tcl write
         if has_connection:
             # Update position data
             if status.get('has_gps_data', False):
                 pos = status.get('latest_position', {})
-                self.tk_vars['latitude'].set(f"{pos.get('latitude', 0):.6f}")
-                self.tk_vars['longitude'].set(f"{pos.get('longitude', 0):.6f}")
-                self.tk_vars['altitude'].set(f"{pos.get('altitude', 0) * METERS_TO_FEET:.0f}")
-                self.tk_vars['speed'].set(f"{pos.get('speed', 0) * MPS_TO_KTS:.1f}")
-                self.tk_vars['track'].set(f"{pos.get('track', 0):.0f}")
+                raw = (
+                    pos.get('latitude', 0), pos.get('longitude', 0),
+                    pos.get('altitude', 0), pos.get('speed', 0),
+                    pos.get('track', 0)
+                )
+                if raw != self._last_pos:
+                    self._last_pos = raw
+                    lat, lon, alt, speed, track = raw
+                    self._set_var('latitude', f"{lat:.6f}")
+                    self._set_var('longitude', f"{lon:.6f}")
+                    self._set_var('altitude', f"{alt * METERS_TO_FEET:.0f}")
+                    self._set_var('speed', f"{speed * MPS_TO_KTS:.1f}")
+                    self._set_var('track', f"{track:.0f}")
 
             # Update attitude data
             if status.get('has_attitude_data', False):
                 att = status.get('latest_attitude', {})
-                self.tk_vars['heading'].set(f"{att.get('heading', 0):.0f}")
-                self.tk_vars['pitch'].set(f"{att.get('pitch', 0):.0f}")
-                self.tk_vars['roll'].set(f"{att.get('roll', 0):.0f}")
+                raw = (
+                    att.get('heading', 0), att.get('pitch', 0),
+                    att.get('roll', 0)
+                )
+                if raw != self._last_att:
+                    self._last_att = raw
+                    heading, pitch, roll = raw
+                    self._set_var('heading', f"{heading:.0f}")
+                    self._set_var('pitch', f"{pitch:.0f}")
+                    self._set_var('roll', f"{roll:.0f}")
 
     def _update_recording_status(self) -> None:
         """Update the recording status display."""
         if not self.bridge:
             return
 
-        # Get recording status
-        status = self.bridge.get_recording_status()
-
-        # Get recording info
-        recording_info = status.get('recording', {})
-        is_recording = recording_info.get('recording', False)
-
-        # Update recording status
-        if is_recording:
-            self.tk_vars['recording_status'].set("Recording")
-            self.tk_vars['recording_color'].set("green")
-            self.tk_vars['fix_count'].set(str(recording_info.get('fix_count', 0)))
-            self.tk_vars['duration'].set(recording_info.get('duration_formatted', "00:00:00"))
+        # The cheap predicate decides the branch; the nested status
+        # dictionaries are only built while a recording is running,
+        # so idle watchdog ticks skip them entirely
+        if self.bridge.is_recording():
+            recording_info = self.bridge.get_recording_status().get('recording', {})
+            self._set_var('recording_status', "Recording")
+            self._set_fg('recording_status', "green")
+            self._set_var('fix_count', str(recording_info.get('fix_count', 0)))
+            self._set_var('duration', recording_info.get('duration_formatted', "00:00:00"))
 
             # Update button states
-            self.components['start_button'].config(state="disabled")
-            self.components['stop_button'].config(state="normal")
+            self._set_button_state('start_button', "disabled")
+            self._set_button_state('stop_button', "normal")
 
             # Update status message
-            self.tk_vars['status_message'].set(
-                f"Recording to {os.path.basename(recording_info.get('filename', ''))}"
+            self._set_var('status_message',
+                f"Recording to {_basename(recording_info.get('filename', ''))}"
             )
         else:
-            self.tk_vars['recording_status'].set("Not Recording")
-            self.tk_vars['recording_color'].set("gray")
+            self._set_var('recording_status', "Not Recording")
+            self._set_fg('recording_status', "gray")
 
             # Update button states
-            self.components['start_button'].config(state="normal")
-            self.components['stop_button'].config(state="disabled")
+            self._set_button_state('start_button', "normal")
+            self._set_button_state('stop_button', "disabled")
 
     async def _handle_connection_established(self, event: Event) -> None:
         """Handle connection established event."""
         if not event.data:
             return
 
-        # Update status
-        self.async_loop.call_soon_in_main_thread(
-            self.tk_vars['status_message'].set,
-            "Connected to Aerofly FS4"
-        )
+        # Apply both UI changes with one queued callback
+        def apply() -> None:
+            self._set_var('status_message', "Connected to Aerofly FS4")
+            self._update_connection_status()
 
-        # Update connection status immediately
-        self.async_loop.call_soon_in_main_thread(
-            self._update_connection_status
-        )
+        self.async_loop.call_soon_in_main_thread(apply)
 
         logger.info("Connection established with Aerofly FS4")
 
@@ -1075,16 +1193,12 @@ class GUI:
         if not event.data:
             return
 
-        # Update status
-        self.async_loop.call_soon_in_main_thread(
-            self.tk_vars['status_message'].set,
-            "Connection with Aerofly FS4 lost"
-        )
+        # Apply both UI changes with one queued callback
+        def apply() -> None:
+            self._set_var('status_message', "Connection with Aerofly FS4 lost")
+            self._update_connection_status()
 
-        # Update connection status immediately
-        self.async_loop.call_soon_in_main_thread(
-            self._update_connection_status
-        )
+        self.async_loop.call_soon_in_main_thread(apply)
 
         logger.info("Connection with Aerofly FS4 lost")
 
@@ -1096,16 +1210,14 @@ class GUI:
         # Get filename
         filename = event.data.get('filename', 'Unknown')
 
-        # Update status
-        self.async_loop.call_soon_in_main_thread(
-            self.tk_vars['status_message'].set,
-            f"Recording to {os.path.basename(filename)}"
-        )
+        # Apply all UI changes with one queued callback instead of one
+        # queue submission (and drain iteration) per widget touched
+        def apply() -> None:
+            self._set_var('status_message',
+                          f"Recording to {_basename(filename)}")
+            self._update_recording_status()
 
-        # Update recording status immediately
-        self.async_loop.call_soon_in_main_thread(
-            self._update_recording_status
-        )
+        self.async_loop.call_soon_in_main_thread(apply)
 
         logger.info(f"Recording started: {filename}")
 
@@ -1118,41 +1230,30 @@ class GUI:
         filename = event.data.get('filename')
         fix_count = event.data.get('fix_count', 0)
 
-        # Update status
-        if filename:
-            self.async_loop.call_soon_in_main_thread(
-                self.tk_vars['status_message'].set,
-                f"Recording stopped. Flight saved to {os.path.basename(filename)}"
-            )
-
-            # Show success message
-            self.async_loop.call_soon_in_main_thread(
-                messagebox.showinfo,
-                "Recording Complete",
-                f"Flight recorded and saved to:\n{filename}"
-            )
-
-            # Refresh file list
-            self.async_loop.call_soon_in_main_thread(
-                self._refresh_file_list
-            )
-        else:
-            self.async_loop.call_soon_in_main_thread(
-                self.tk_vars['status_message'].set,
-                "Recording stopped. No flight data recorded"
-            )
-
-            # Show info message
-            self.async_loop.call_soon_in_main_thread(
-                messagebox.showinfo,
-                "Recording Complete",
-                "No flight data was recorded"
-            )
+        # Apply all UI changes with one queued callback instead of one
+        # queue submission per widget touched
+        def apply() -> None:
+            if filename:
+                self._set_var(
+                    'status_message',
+                    f"Recording stopped. Flight saved to {_basename(filename)}"
+                )
+                self._update_recording_status()
+                self._refresh_file_list()
+                messagebox.showinfo(
+                    "Recording Complete",
+                    f"Flight recorded and saved to:\n{filename}"
+                )
+            else:
+                self._set_var('status_message',
+                              "Recording stopped. No flight data recorded")
+                self._update_recording_status()
+                messagebox.showinfo(
+                    "Recording Complete",
+                    "No flight data was recorded"
+                )
 
-        # Update recording status immediately
-        self.async_loop.call_soon_in_main_thread(
-            self._update_recording_status
-        )
+        self.async_loop.call_soon_in_main_thread(apply)
 
         if filename:
             logger.info(f"Recording stopped: {filename}, {fix_count} fixes")
@@ -1164,19 +1265,46 @@ class GUI:
         if not event.data:
             return
 
-        # Get fix count
-        fix_count = event.data.get('fix_count', 0)
+        # Conflate fix-count updates: remember the newest value and arm
+        # a flush timer; at high fix rates the label updates at the
+        # flush interval instead of once per fix
+        self._pending_fix_count = event.data.get('fix_count', 0)
+        if not self._fix_count_timer_armed:
+            self._fix_count_timer_armed = True
+            self.async_loop.loop.call_later(
+                _FIX_COUNT_FLUSH_SECONDS, self._flush_fix_count
+            )
 
-        # Update fix count
-        self.async_loop.call_soon_in_main_thread(
-            self.tk_vars['fix_count'].set,
-            str(fix_count)
-        )
+    def _flush_fix_count(self) -> None:
+        """Write the most recent conflated fix count to the UI."""
+        self._fix_count_timer_armed = False
+        if self._pending_fix_count is not None:
+            # Loop callbacks already run on the Tk thread, so the
+            # variable can be set directly
+            self._set_var('fix_count', str(self._pending_fix_count))
 
     async def _handle_data_received(self, event: Event) -> None:
-        """Handle data received event."""
-        # Update connection status on next refresh cycle
-        pass
+        """
+        Handle data received event.
+
+        Drives the telemetry display: each datagram requests a status
+        refresh, rate limited to the configured refresh rate so a fast
+        simulator stream doesn't flood the Tk side.
+        """
+        now = time.monotonic()
+        if now - self._last_ui_push < GUI_REFRESH_RATE_MS / 1000:
+            return
+        self._last_ui_push = now
+
+        self.async_loop.call_soon_in_main_thread(
+            self._update_connection_status,
+            coalesce_key=('call', 'connection_status')
+        )
+        if self.bridge and self.bridge.running:
+            self.async_loop.call_soon_in_main_thread(
+                self._update_recording_status,
+                coalesce_key=('call', 'recording_status')
+            )
 
     async def _handle_error(self, event: Event) -> None:
         """Handle error event."""
@@ -1188,20 +1316,19 @@ class GUI:
         component = event.data.get('component', 'Unknown')
 
         # Log the error
-        logger.error(f"Error in {component}: {message}")
+        logger.error("Error in %s: %s", component, message)
 
         # Show error message for certain critical components
-        critical_components = ['UDPServer', 'IGCWriter', 'AeroflyBridge']
-
-        if component in critical_components:
+        if component in _CRITICAL_ERROR_COMPONENTS:
             # Update status message
             self.async_loop.call_soon_in_main_thread(
-                self.tk_vars['status_message'].set,
-                f"Error in {component}: {message}"
+                self._set_var, 'status_message',
+                f"Error in {component}: {message}",
+                coalesce_key=('var', 'status_message')
             )
 
             # Show error dialog for serious errors
-            if 'Failed to start' in message or 'Connection' in message:
+            if _SERIOUS_ERROR_RE.search(message):
                 self.async_loop.call_soon_in_main_thread(
                     messagebox.showerror,
                     "Error",
@@ -1225,7 +1352,7 @@ class GUI:
 
             # Get selected glider info for IGC file
             glider_info = {}
-            if hasattr(self, 'components') and 'glider_tab' in self.components:
+            if 'glider_tab' in self.components:
                 glider_info = self.components['glider_tab'].get_selected_glider_info()
 
             # Start recording
@@ -1236,11 +1363,11 @@ class GUI:
                 glider_info=glider_info  # Pass additional glider info
             ):
                 # Update UI
-                self.start_button.configure(state="disabled")
-                self.stop_button.configure(state="normal")
+                self._set_button_state('start_button', "disabled")
+                self._set_button_state('stop_button', "normal")
                 
                 # Update status
-                self.tk_vars['status_message'].set("Recording started")
+                self._set_var('status_message', "Recording started")
                 
                 logger.info("Recording started")
             else:
@@ -1262,7 +1389,7 @@ class GUI:
             return
 
         # Check if recording
-        if not self.bridge.get_recording_status().get('recording', {}).get('recording', False):
+        if not self._is_recording():
             messagebox.showinfo("Not Recording", "No recording is currently in progress")
             return
 
@@ -1272,7 +1399,7 @@ class GUI:
         )
 
         # Update status
-        self.tk_vars['status_message'].set("Stopping recording...")
+        self._set_var('status_message', "Stopping recording...")
 
     def _change_udp_port(self) -> None:
         """Change the UDP port."""
@@ -1322,7 +1449,7 @@ class GUI:
         """Restart the bridge with new settings."""
         try:
             # Update status
-            self.tk_vars['status_message'].set("Restarting bridge...")
+            self._set_var('status_message', "Restarting bridge...")
 
             # Stop the bridge
             await self.bridge.stop()
@@ -1332,7 +1459,7 @@ class GUI:
 
             # Start the bridge
             if not await self.bridge.start():
-                self.tk_vars['status_message'].set("Failed to restart bridge")
+                self._set_var('status_message', "Failed to restart bridge")
                 messagebox.showerror(
                     "Error",
                     "Failed to restart the bridge. Please check the logs for details."
@@ -1340,7 +1467,7 @@ class GUI:
                 return
 
             # Update status
-            self.tk_vars['status_message'].set("Bridge restarted")
+            self._set_var('status_message', "Bridge restarted")
 
             # Update UI immediately
             self._update_connection_status()
@@ -1352,7 +1479,7 @@ class GUI:
             )
         except Exception as e:
             logger.error(f"Error restarting bridge: {e}")
-            self.tk_vars['status_message'].set(f"Error restarting bridge: {str(e)}")
+            self._set_var('status_message', f"Error restarting bridge: {str(e)}")
             messagebox.showerror(
                 "Error",
                 f"Error restarting bridge: {str(e)}"
@@ -1375,6 +1502,9 @@ class GUI:
             settings.set('igc_directory', new_dir)
             settings.save_settings()
 
+            # Refresh the cached directory
+            self._igc_dir = new_dir
+
             # Update UI
             self.tk_vars['igc_directory'].set(new_dir)
 
@@ -1430,36 +1560,80 @@ class GUI:
             )
 
     def _refresh_file_list(self) -> None:
-        """Refresh the IGC file list."""
-        # Clear the current list
-        file_tree = self.components['file_tree']
-        for item in file_tree.get_children():
-            file_tree.delete(item)
-
-        try:
-            # Get IGC directory
-            igc_dir = get_igc_directory()
+        """
+        Request a file-list refresh.
 
-            # Get file list
-            igc_files = list_igc_files(igc_dir)
+        Refreshes are debounced with a short after() window so a burst
+        of calls collapses into one directory scan and repopulation.
+        """
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.root.after(50, self._do_refresh_file_list)
+
+    def _do_refresh_file_list(self) -> None:
+        """Perform a (debounced) refresh of the IGC file list."""
+        self._refresh_after_id = None
+
+        # Scan the directory on a worker thread so a slow disk or
+        # network share never stalls the event loop; the generation
+        # counter discards results from a superseded refresh
+        self._file_list_gen += 1
+        self.async_loop.create_task(
+            self._refresh_file_list_async(self._file_list_gen)
+        )
 
-            # Add files to treeview
-            for file_path in igc_files:
-                # Get file info
-                from ..io.files import get_file_info
-                info = get_file_info(file_path)
+    async def _refresh_file_list_async(self, generation: int) -> None:
+        """Scan the IGC directory off-loop and repopulate the tree."""
+        try:
+            # Get IGC directory (cached after the first resolution)
+            igc_dir = self._get_igc_dir()
 
-                # Format data
-                filename = os.path.basename(file_path)
-                date = info.get('modified', "")
-                size = info.get('size_str', "")
+            # Get file list with sizes and timestamps from one scandir
+            # pass instead of a stat round-trip per file
+            entries = await asyncio.to_thread(list_igc_file_entries, igc_dir)
 
-                # Add to treeview
-                file_tree.insert("", "end", values=(filename, date, size), tags=(file_path,))
+            # Populate the tree in batches on the Tk side: the newest
+            # files appear immediately and large directories never block
+            # mainloop for one long run of Treeview inserts
+            self.async_loop.call_soon_in_main_thread(
+                self._insert_file_rows, entries, 0, generation
+            )
 
         except Exception as e:
             logger.error(f"Error refreshing file list: {e}")
 
+    def _insert_file_rows(self, entries: List[Dict[str, Any]],
+                          start: int, generation: int) -> None:
+        """Insert one batch of file rows, deferring the rest via after()."""
+        if generation != self._file_list_gen:
+            return
+
+        file_tree = self.components['file_tree']
+
+        if start == 0:
+            # Diff against what the tree already shows: a refresh that
+            # found no changes (the common case for debounced triggers)
+            # skips the clear and all N reinserts
+            if entries == self._applied_file_entries:
+                return
+            self._applied_file_entries = entries
+            for item in file_tree.get_children():
+                file_tree.delete(item)
+
+        end = min(start + _FILE_LIST_BATCH_SIZE, len(entries))
+        for entry in entries[start:end]:
+            date = time.strftime(
+                '%Y-%m-%d %H:%M:%S', time.localtime(entry['modified_ts'])
+            )
+            file_tree.insert(
+                "", "end",
+                values=(entry['filename'], date, entry['size_str']),
+                tags=(entry['path'],)
+            )
+
+        if end < len(entries):
+            self.root.after(1, self._insert_file_rows, entries, end, generation)
+
     def _open_selected_file(self) -> None:
         """Open the selected IGC file."""
         # Get selected item
@@ -1477,31 +1651,37 @@ class GUI:
         item = selection[0]
         file_path = file_tree.item(item, "tags")[0]
 
-        # Open file
-        if open_file_or_directory(file_path):
-            logger.info(f"Opened file: {file_path}")
-        else:
-            messagebox.showerror(
-                "Error",
-                f"Failed to open file: {file_path}"
-            )
+        # Open file off-loop; the system launcher can be slow
+        self.async_loop.create_task(self._open_path_async(file_path, "file"))
 
     def _on_file_double_click(self, event) -> None:
         """Handle double-click on file in treeview."""
         self._open_selected_file()
 
+    def _get_igc_dir(self) -> str:
+        """Get the IGC output directory, resolving it once and caching."""
+        if self._igc_dir is None:
+            self._igc_dir = get_igc_directory()
+        return self._igc_dir
+
     def _open_igc_directory(self) -> None:
         """Open the IGC directory."""
-        # Get IGC directory
-        igc_dir = get_igc_directory()
+        # Get IGC directory (cached after the first resolution)
+        igc_dir = self._get_igc_dir()
 
-        # Open directory
-        if open_file_or_directory(igc_dir):
-            logger.info(f"Opened directory: {igc_dir}")
+        # Open directory off-loop; the system launcher can be slow
+        self.async_loop.create_task(self._open_path_async(igc_dir, "directory"))
+
+    async def _open_path_async(self, path: str, kind: str) -> None:
+        """Open a file or directory with the system launcher off-loop."""
+        opened = await asyncio.to_thread(open_file_or_directory, path)
+        if opened:
+            logger.info(f"Opened {kind}: {path}")
         else:
-            messagebox.showerror(
+            self.async_loop.call_soon_in_main_thread(
+                messagebox.showerror,
                 "Error",
-                f"Failed to open directory: {igc_dir}"
+                f"Failed to open {kind}: {path}"
             )
 
     def _open_website(self) -> None:
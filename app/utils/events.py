@@ -3,6 +3,7 @@ Event system for Aerofly FS4 IGC Recorder.
 Implements a Observer pattern to allow communication between components.
 """
 
+from collections import deque
 from enum import Enum, auto
 from typing import Dict, List, Any, Callable, Optional
 from dataclasses import dataclass
@@ -39,23 +40,86 @@ class EventType(Enum):
     SETTINGS_CHANGED = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
-    """Represents an event in the application"""
+    """
+    Represents an event in the application.
+
+    Events are constructed at the telemetry rate, so the constructor
+    stays cheap: the timestamp comes from the monotonic clock (faster
+    than wall time, and only used for relative ordering) and the UUID
+    is generated lazily via event_id, since no subscriber reads it on
+    the hot path. Slots avoid a per-instance __dict__, and events
+    without payload keep data as None (handlers already treat a falsy
+    data as "nothing to do") instead of allocating an empty dict.
+    """
     type: EventType
     data: Optional[Dict[str, Any]] = None
     source: Optional[str] = None
     timestamp: float = 0.0
-    id: str = ""
-    
+    id: Optional[str] = None
+
     def __post_init__(self):
-        """Initialize event with timestamp and ID if not provided"""
+        """Initialize event with timestamp if not provided"""
         if not self.timestamp:
-            self.timestamp = time.time()
-        if not self.id:
+            self.timestamp = time.monotonic()
+
+    @property
+    def event_id(self) -> str:
+        """Unique event ID, generated on first access"""
+        if self.id is None:
             self.id = str(uuid.uuid4())
-        if not self.data:
-            self.data = {}
+        return self.id
+
+
+def _noop_init(self) -> None:
+    """Replacement EventBus.__init__ once the singleton is built"""
+
+
+class _AsyncSubscriber:
+    """
+    Long-lived worker feeding an async callback from a bounded queue.
+
+    publish used to spawn a new task per event per async subscriber,
+    which piles up without limit when a handler is slower than the
+    event rate. Each async subscriber instead gets a one-slot queue
+    and a single worker task; when the slot is already full the stale
+    pending event is replaced by the newest one, so a slow handler
+    always sees the latest state instead of a growing backlog.
+    """
+
+    __slots__ = ('callback', 'queue', 'task')
+
+    def __init__(self, callback: Callable[[Event], Any]):
+        self.callback = callback
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self.task = asyncio.create_task(self._worker())
+
+    def dispatch(self, event: Event) -> None:
+        """Queue an event, conflating with any stale pending one."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self.queue.put_nowait(event)
+
+    async def _worker(self) -> None:
+        """Deliver queued events to the callback, one at a time."""
+        while True:
+            event = await self.queue.get()
+            try:
+                await self.callback(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Error in event subscriber: %s", e)
+
+    def close(self) -> None:
+        """Cancel the worker task."""
+        self.task.cancel()
 
 
 class EventBus:
@@ -64,28 +128,49 @@ class EventBus:
     Implements the Singleton pattern to ensure only one instance exists.
     """
     _instance = None
-    
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(EventBus, cls).__new__(cls)
-            cls._instance._initialized = False
         return cls._instance
-    
+
     def __init__(self):
-        if self._initialized:
-            return
-            
-        # Dictionary of event subscribers: {EventType: [callbacks]}
-        self._subscribers: Dict[EventType, List[Callable[[Event], None]]] = {}
+
+        # Dictionary of event subscribers, keyed by the callback itself
+        # for O(1) membership checks and removal. Bound methods hash
+        # and compare by __self__/__func__, so re-subscribing
+        # obj.method after a restart dedupes correctly even though each
+        # attribute access yields a fresh bound-method object (keying
+        # by id() would not). Values are either the plain sync callback
+        # or the _AsyncSubscriber wrapping an async one:
+        # {EventType: {callback: entry}}
+        self._subscribers: Dict[EventType, Dict[Callable, Any]] = {}
+
+        # Copy-on-write snapshots of the per-type delivery functions
+        # (sync callbacks or async-subscriber dispatchers).
+        # subscribe/unsubscribe rebuild the tuple under the lock;
+        # publish reads it without locking (dict reads are atomic under
+        # the GIL), so frequent publishes never serialize on rare
+        # subscription changes
+        self._snapshots: Dict[EventType, tuple] = {}
         
-        # Event history for debugging (limited size)
-        self._event_history: List[Event] = []
+        # Event history for debugging; a bounded deque evicts the
+        # oldest entry in O(1) instead of list.pop(0)'s O(n) shift
         self._max_history_size = 100
+        self._event_history: deque = deque(maxlen=self._max_history_size)
         
         # Lock for thread safety
         self._lock = asyncio.Lock()
+
+        # History only matters when debugging; cache the level check so
+        # production publishes skip the append entirely
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
-        self._initialized = True
+        # The singleton is fully built now; repeat EventBus() calls
+        # would re-enter this method only to hit a guard, so swap in a
+        # no-op instead of paying the dispatch and check every time
+        EventBus.__init__ = _noop_init
+
         logger.info("EventBus initialized")
     
     async def subscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
@@ -97,12 +182,29 @@ class EventBus:
             callback: Function to call when event occurs
         """
         async with self._lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
-            
-            if callback not in self._subscribers[event_type]:
-                self._subscribers[event_type].append(callback)
-                logger.debug(f"Subscribed to {event_type.name}")
+            self._install(event_type, callback)
+
+    async def subscribe_many(self, mapping: Dict[EventType, Callable[[Event], None]]) -> None:
+        """
+        Subscribe a batch of handlers with a single lock acquisition.
+
+        Args:
+            mapping: Event types mapped to their callback functions
+        """
+        async with self._lock:
+            for event_type, callback in mapping.items():
+                self._install(event_type, callback)
+
+    def _install(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
+        """Install one subscription; must be called with the lock held"""
+        callbacks = self._subscribers.setdefault(event_type, {})
+        if callback not in callbacks:
+            if asyncio.iscoroutinefunction(callback):
+                callbacks[callback] = _AsyncSubscriber(callback)
+            else:
+                callbacks[callback] = callback
+            self._snapshots[event_type] = self._build_snapshot(callbacks)
+            logger.debug("Subscribed to %s", event_type.name)
     
     async def unsubscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> bool:
         """
@@ -116,12 +218,36 @@ class EventBus:
             bool: True if successfully unsubscribed, False otherwise
         """
         async with self._lock:
-            if event_type in self._subscribers and callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback)
-                logger.debug(f"Unsubscribed from {event_type.name}")
+            callbacks = self._subscribers.get(event_type, {})
+            removed = callbacks.pop(callback, None)
+            if removed is not None:
+                if isinstance(removed, _AsyncSubscriber):
+                    removed.close()
+                self._snapshots[event_type] = self._build_snapshot(callbacks)
+                logger.debug("Unsubscribed from %s", event_type.name)
                 return True
             return False
+
+    @staticmethod
+    def _build_snapshot(callbacks: Dict[Callable, Any]) -> tuple:
+        """Build the immutable delivery-function snapshot for publish"""
+        return tuple(
+            entry.dispatch if isinstance(entry, _AsyncSubscriber) else entry
+            for entry in callbacks.values()
+        )
     
+    def has_subscribers(self, event_type: EventType) -> bool:
+        """
+        Check whether any callbacks are subscribed to an event type.
+
+        Args:
+            event_type: The type of event to check
+
+        Returns:
+            bool: True if at least one subscriber exists
+        """
+        return bool(self._snapshots.get(event_type))
+
     async def publish(self, event: Event) -> None:
         """
         Publish an event to all subscribers.
@@ -129,40 +255,39 @@ class EventBus:
         Args:
             event: The event to publish
         """
-        # Add event to history
-        self._add_to_history(event)
-        
-        # Get subscribers for this event type
-        subscribers = []
-        async with self._lock:
-            if event.type in self._subscribers:
-                subscribers = self._subscribers[event.type].copy()
+        # Record history only when debugging: it exists for diagnosis,
+        # and the append per event is pure overhead otherwise
+        if self._debug_enabled:
+            self._add_to_history(event)
+
+
+        # Read the copy-on-write snapshot without taking the lock:
+        # subscriptions only change at startup/shutdown, while publishes
+        # run at the telemetry rate
+        subscribers = self._snapshots.get(event.type, ())
         
-        # Notify all subscribers
+        # Notify all subscribers. Each snapshot entry is a plain sync
+        # callback or an async subscriber's dispatch, so delivery is a
+        # direct call either way — no per-event coroutine check and no
+        # task allocation
         if subscribers:
-            logger.debug(f"Publishing event {event.type.name} to {len(subscribers)} subscribers")
-            for callback in subscribers:
+            logger.debug("Publishing event %s to %d subscribers",
+                         event.type.name, len(subscribers))
+            for deliver in subscribers:
                 try:
-                    if asyncio.iscoroutinefunction(callback):
-                        # Schedule async callbacks without awaiting them
-                        asyncio.create_task(callback(event))
-                    else:
-                        # Call sync callbacks directly
-                        callback(event)
+                    deliver(event)
                 except Exception as e:
-                    logger.error(f"Error in event subscriber: {e}")
+                    logger.error("Error in event subscriber: %s", e)
         else:
-            logger.debug(f"No subscribers for event {event.type.name}")
+            logger.debug("No subscribers for event %s", event.type.name)
     
     def _add_to_history(self, event: Event) -> None:
-        """Add an event to the history, maintaining maximum size"""
+        """Add an event to the history; the deque evicts the oldest entry"""
         self._event_history.append(event)
-        if len(self._event_history) > self._max_history_size:
-            self._event_history.pop(0)
-    
+
     def get_event_history(self) -> List[Event]:
         """Get a copy of the event history"""
-        return self._event_history.copy()
+        return list(self._event_history)
     
     def clear_history(self) -> None:
         """Clear the event history"""
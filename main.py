@@ -5,10 +5,9 @@ Entry point script that launches the GUI interface.
 """
 
 import argparse
-import asyncio
+import functools
 import logging
 import sys
-from pathlib import Path
 
 # Configure logging
 logging.basicConfig(
@@ -17,8 +16,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def parse_args():
-    """Parse command line arguments."""
+@functools.lru_cache(maxsize=None)
+def _build_parser():
+    """Build the argument parser once; repeat calls reuse it."""
     parser = argparse.ArgumentParser(
         description='Aerofly FS4 IGC Recorder'
     )
@@ -27,34 +27,61 @@ def parse_args():
         action='store_true',
         help='Enable debug logging'
     )
-    return parser.parse_args()
+    return parser
 
-async def main():
+def parse_args():
+    """Parse command line arguments."""
+    return _build_parser().parse_args()
+
+def main(args):
     """Main entry point."""
-    args = parse_args()
-    
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
-    
+
     try:
-        # Import GUI module
+        # Import GUI module (deferred so argparse errors and --help
+        # never pay the app/Tk import cost)
         from app.ui.gui import GUI
-        
-        # Create and run GUI interface
+
+        # Create and run GUI interface. GUI.run owns the main thread:
+        # it drives Tk's mainloop and ticks its own asyncio loop from a
+        # Tk timer, so it must not be wrapped in asyncio.run — a second
+        # running loop on this thread would make every tick's
+        # run_forever raise RuntimeError.
         gui = GUI()
-        await gui.run()
-        
+        gui.run()
+
     except ImportError:
         logger.error("GUI module not found")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Error running GUI: {e}")
+        logger.error("Error running GUI: %s", e)
         sys.exit(1)
 
+def run():
+    """Synchronous entry point for the console script."""
+    # Parse arguments before touching asyncio so --help and argument
+    # errors exit without building an event loop
+    args = parse_args()
+
+    # No event loop policy override: on Windows the default proactor
+    # loop (Python 3.8+) handles the UDP datagram endpoint this app is
+    # built around and is the faster IOCP-backed implementation, so
+    # forcing the selector loop would only cost throughput
+
+    # On POSIX, use uvloop's C event loop when it happens to be
+    # installed: per-packet scheduling on the UDP ingest path is
+    # noticeably cheaper than with the pure-Python loop. Installing the
+    # policy here means AsyncTkinterLoop's new_event_loop() picks it
+    # up. It stays an optional extra, not a dependency.
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
+    main(args)
+
 if __name__ == '__main__':
-    if sys.platform == 'win32':
-        # Set event loop policy for Windows
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-    
-    # Run main function
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
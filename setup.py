@@ -7,13 +7,14 @@ setup(
     author="Juan Luis Gabriel",
     url="https://github.com/jlgabriel/aerofly-igc-recorder",
     packages=find_packages(),
-    python_requires=">=3.8",
+    py_modules=["main"],
+    python_requires=">=3.10",
     install_requires=[
         "aerofiles",  # For IGC file handling
     ],
     entry_points={
         'console_scripts': [
-            'aerofly-igc-recorder=main:main',
+            'aerofly-igc-recorder=main:run',
         ],
     },
     classifiers=[
@@ -21,8 +22,6 @@ setup(
         "Intended Audience :: End Users/Desktop",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
@@ -3,12 +3,11 @@ Pytest configuration and shared fixtures.
 """
 
 import pytest
-import sys
 from pathlib import Path
 
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# The project root is put on sys.path by pytest itself via the
+# pythonpath option in pyproject.toml, resolved once per session
+# instead of a per-worker sys.path mutation here.
 
 
 @pytest.fixture(scope="session")
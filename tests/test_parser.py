@@ -11,9 +11,13 @@ from app.data.models import XGPSData, XATTData, UnknownData, DataType
 class TestForeFlightParser:
     """Test cases for ForeFlightParser."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def parser(self):
-        """Create a parser instance for testing."""
+        """Create a parser instance shared by the whole module.
+
+        The parser is stateless (see the singleton test), so one
+        instance can serve every test here.
+        """
         return ForeFlightParser()
 
     def test_parse_valid_xgps_data(self, parser):
@@ -194,6 +198,108 @@ class TestForeFlightParser:
         assert data.timestamp is not None
         assert before <= data.timestamp <= after
 
+    def test_parse_bytes_valid_xgps_data(self, parser):
+        """Test parsing valid XGPS data from raw bytes."""
+        buf = b"XGPSAerofly FS 4,-122.345678,37.654321,123.45,45.67,89.12"
+
+        data = parser.parse_bytes(buf)
+
+        assert isinstance(data, XGPSData)
+        assert data.sim_name == "Aerofly FS 4"
+        assert abs(data.longitude - (-122.345678)) < 0.000001
+        assert abs(data.latitude - 37.654321) < 0.000001
+        assert abs(data.alt_msl_meters - 123.45) < 0.01
+        assert abs(data.track_deg - 45.67) < 0.01
+        assert abs(data.ground_speed_mps - 89.12) < 0.01
+        assert data.data_type == DataType.GPS
+
+    def test_parse_bytes_valid_xatt_data(self, parser):
+        """Test parsing valid XATT data from raw bytes."""
+        buf = b"XATTAerofly FS 4,180.5,15.3,-5.7"
+
+        data = parser.parse_bytes(buf)
+
+        assert isinstance(data, XATTData)
+        assert data.sim_name == "Aerofly FS 4"
+        assert abs(data.heading_deg - 180.5) < 0.01
+        assert abs(data.pitch_deg - 15.3) < 0.01
+        assert abs(data.roll_deg - (-5.7)) < 0.01
+        assert data.data_type == DataType.ATTITUDE
+
+    def test_parse_bytes_matches_parse_line(self, parser):
+        """Test that the bytes path parses a line identically to the str path."""
+        line = "XGPSAerofly FS 4,-122.345678,37.654321,123.45,45.67,89.12"
+
+        from_str = parser.parse_line(line)
+        from_bytes = parser.parse_bytes(line.encode('ascii'))
+
+        assert type(from_str) is type(from_bytes)
+        assert from_str.sim_name == from_bytes.sim_name
+        assert from_str.longitude == from_bytes.longitude
+        assert from_str.latitude == from_bytes.latitude
+        assert from_str.alt_msl_meters == from_bytes.alt_msl_meters
+        assert from_str.track_deg == from_bytes.track_deg
+        assert from_str.ground_speed_mps == from_bytes.ground_speed_mps
+
+    def test_parse_bytes_strips_datagram_framing(self, parser):
+        """Test that trailing newline framing from a datagram is tolerated."""
+        buf = b"XATTAerofly FS 4,180.5,15.3,-5.7\r\n"
+
+        data = parser.parse_bytes(buf)
+
+        assert isinstance(data, XATTData)
+        assert abs(data.heading_deg - 180.5) < 0.01
+
+    def test_parse_bytes_invalid_format(self, parser):
+        """Test parsing bytes with an unknown prefix."""
+        data = parser.parse_bytes(b"INVALID_FORMAT")
+
+        assert isinstance(data, UnknownData)
+        assert data.raw_line == "INVALID_FORMAT"
+        assert data.data_type == DataType.UNKNOWN
+
+    def test_parse_bytes_empty(self, parser):
+        """Test parsing an empty datagram."""
+        data = parser.parse_bytes(b"")
+
+        assert isinstance(data, UnknownData)
+        assert data.raw_line == ""
+
+    def test_parse_bytes_xgps_insufficient_fields(self, parser):
+        """Test parsing XGPS bytes with insufficient fields."""
+        data = parser.parse_bytes(b"XGPSAerofly FS 4,-122.345678,37.654321")
+
+        assert isinstance(data, UnknownData)
+
+    def test_parse_bytes_xgps_invalid_number(self, parser):
+        """Test parsing XGPS bytes with an invalid number."""
+        data = parser.parse_bytes(b"XGPSAerofly FS 4,invalid,37.654321,123.45,45.67,89.12")
+
+        assert isinstance(data, UnknownData)
+
+    def test_parse_bytes_xatt_insufficient_fields(self, parser):
+        """Test parsing XATT bytes with insufficient fields."""
+        data = parser.parse_bytes(b"XATTAerofly FS 4,180.5")
+
+        assert isinstance(data, UnknownData)
+
+    def test_parse_bytes_xatt_invalid_number(self, parser):
+        """Test parsing XATT bytes with an invalid number."""
+        data = parser.parse_bytes(b"XATTAerofly FS 4,invalid,15.3,-5.7")
+
+        assert isinstance(data, UnknownData)
+
+    def test_parse_bytes_timestamp_passthrough(self, parser):
+        """Test that a supplied timestamp is attached to the parsed data."""
+        ts = datetime.datetime(2025, 6, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+
+        data = parser.parse_bytes(
+            b"XGPSAerofly FS 4,-122.345678,37.654321,123.45,45.67,89.12", ts
+        )
+
+        assert isinstance(data, XGPSData)
+        assert data.timestamp == ts
+
     def test_parser_singleton_behavior(self):
         """Test that parser can be instantiated multiple times."""
         parser1 = ForeFlightParser()